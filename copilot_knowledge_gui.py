@@ -12,14 +12,23 @@ Data stored in docs/copilot/data/store.json
 """
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import re
+import string
 import tkinter as tk
-from dataclasses import dataclass, asdict
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from tkinter import ttk, messagebox
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+try:  # optional C-accelerated JSON; the stdlib json module is used when it is missing
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 DATA_PATH = Path('docs/copilot/data/store.json')
 PATTERN_DIR = Path('docs/copilot/patterns')
@@ -29,14 +38,55 @@ ISO = '%Y-%m-%dT%H:%M:%SZ'
 
 PRIORITIES = ['low', 'medium', 'high']
 STATUSES = ['open', 'answered', 'archived']
+_PRIORITY_RANK = {p: i for i, p in enumerate(PRIORITIES)}
+
+class _SlugTable(dict):
+    """str.translate table: ASCII letters/digits map to themselves, everything else to '-'."""
+
+    def __missing__(self, key: int) -> str:
+        return '-'
+
+_SLUG_TABLE = _SlugTable((ord(c), c) for c in string.ascii_letters + string.digits)
+_DASH_RUN_RE = re.compile(r'-{2,}')
+_ID_RE = re.compile(r'^Q-(\d{8})-(\d+)$')
+_ANSWER_KEYS = frozenset(('timestamp', 'content'))
+_FILTER_CACHE_SIZE = 16
+_PAGE_SIZE = 200  # Treeview rows inserted per page
+_BULK_UPDATE_ROWS = 50  # unmap the tree while applying more row changes than this
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_DSYNC', 0)
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
 
+def _json_dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _now_iso() -> str:
+    return datetime.utcnow().strftime(ISO)
+
+# __slots__ spelled out because dataclass(slots=True) needs Python 3.10
 @dataclass
 class AnswerEntry:
+    __slots__ = ('timestamp', 'content')
+
     timestamp: str
     content: str
 
 @dataclass
 class Question:
+    # the last three slots are not dataclass fields (a slot cannot also carry a
+    # field default); __post_init__ sets them:
+    # - _answer_history_raw: answer history as loaded from JSON; AnswerEntry objects
+    #   are only built on first access
+    # - _answer_history: those AnswerEntry objects, or None until then
+    # - tags_lower: lower-cased tags joined as '\x00a\x00b\x00' so a tag filter is one substring test
+    __slots__ = ('id', 'title', 'context', 'attempts', 'tags', 'priority', 'status', 'created', 'updated',
+                 '_answer_history_raw', '_answer_history', 'tags_lower')
+
     id: str
     title: str
     context: str
@@ -44,19 +94,71 @@ class Question:
     tags: List[str]
     priority: str
     status: str
-    answer: str
-    answer_history: List[AnswerEntry]
     created: str
     updated: str
 
+    def __post_init__(self) -> None:
+        self._answer_history_raw: List[dict] = []
+        self._answer_history: Optional[List[AnswerEntry]] = None
+        self.index_tags()
+
+    def index_tags(self) -> None:
+        """Recompute ``tags_lower``; call after reassigning ``tags``."""
+        self.tags_lower = '\x00' + '\x00'.join(t.lower() for t in self.tags) + '\x00'
+
+    @property
+    def answer_history(self) -> List[AnswerEntry]:
+        if self._answer_history is None:
+            self._answer_history = [AnswerEntry(**a) for a in self._answer_history_raw]
+            self._answer_history_raw = []
+        return self._answer_history
+
+    @property
+    def answer(self) -> str:
+        # derived on demand so appending stays O(1) and the store does not hold the text twice
+        if self._answer_history is None:
+            return '\n\n'.join(a['content'] for a in self._answer_history_raw)
+        return '\n\n'.join(a.content for a in self._answer_history)
+
     def to_json(self) -> dict:
-        d = asdict(self)
-        d['answer_history'] = [asdict(a) for a in self.answer_history]
-        return d
+        # built by hand: dataclasses.asdict deep-copies recursively and is slow
+        if self._answer_history is None:
+            history = [{'timestamp': a['timestamp'], 'content': a['content']} for a in self._answer_history_raw]
+        else:
+            history = [{'timestamp': a.timestamp, 'content': a.content} for a in self._answer_history]
+        return {
+            'id': self.id,
+            'title': self.title,
+            'context': self.context,
+            'attempts': self.attempts,
+            'tags': list(self.tags),
+            'priority': self.priority,
+            'status': self.status,
+            'answer_history': history,
+            'created': self.created,
+            'updated': self.updated,
+        }
 
     @staticmethod
     def from_json(d: dict) -> 'Question':
-        return Question(
+        created = d.get('created')
+        updated = d.get('updated')
+        if created is None or updated is None:
+            now = _now_iso()
+            if created is None:
+                created = now
+            if updated is None:
+                updated = now
+        history = list(d.get('answer_history', []))
+        for a in history:
+            # AnswerEntry objects are built lazily; reject bad entries now so a broken
+            # store still fails in Store.load instead of at the first answer/save
+            if not isinstance(a, dict) or a.keys() != _ANSWER_KEYS:
+                raise ValueError(f"malformed answer_history entry in {d.get('id')}: {a!r}")
+        if not history and d.get('answer'):
+            # older stores kept the answer text without history entries
+            history.append({'timestamp': updated, 'content': d['answer']})
+        q = Question(
             id=d['id'],
             title=d.get('title',''),
             context=d.get('context',''),
@@ -64,75 +166,152 @@ class Question:
             tags=list(d.get('tags', [])),
             priority=d.get('priority','medium'),
             status=d.get('status','open'),
-            answer=d.get('answer',''),
-            answer_history=[AnswerEntry(**a) for a in d.get('answer_history', [])],
-            created=d.get('created', datetime.utcnow().strftime(ISO)),
-            updated=d.get('updated', datetime.utcnow().strftime(ISO)),
+            created=created,
+            updated=updated,
         )
+        q._answer_history_raw = history
+        return q
 
 class Store:
-    def __init__(self, path: Path) -> None:
+    SAVE_DELAY_MS = 500
+
+    def __init__(self, path: Path, scheduler: Optional[tk.Misc] = None) -> None:
         self.path = path
+        # With a Tk scheduler, saves are debounced and written by flush(); without one they are immediate.
+        self._scheduler = scheduler
+        self._save_job: Optional[str] = None
+        self._dirty = False
         self.questions: List[Question] = []
+        self._by_id: Dict[str, Question] = {}
+        self._today_seq: Dict[str, int] = {}  # 'YYYYMMDD' -> highest sequence used
+        self.revision = 0  # bumped on every mutation so views can skip redundant work
+        self._sorted_cache: Optional[List[Question]] = None
         self.load()
 
     def load(self) -> None:
         if not self.path.exists():
             self.questions = []
+            self._reindex()
             return
         try:
-            data = json.loads(self.path.read_text(encoding='utf-8'))
+            data = _json_loads(self.path.read_bytes())
             self.questions = [Question.from_json(q) for q in data.get('questions', [])]
         except Exception as exc:  # noqa: BLE001
-            backup = self.path.with_suffix(f'.corrupt-{datetime.utcnow().strftime(ISO)}.json')
+            backup = self.path.with_suffix(f'.corrupt-{_now_iso()}.json')
             try:
                 self.path.rename(backup)
             except Exception:
                 pass
             messagebox.showerror('Load Error', f'store.json corrupted, moved to {backup}: {exc}')
             self.questions = []
+        self._reindex()
+        self._touch()
+
+    def _reindex(self) -> None:
+        self._by_id = {}
+        self._today_seq = {}
+        for q in self.questions:
+            self._by_id.setdefault(q.id, q)
+            self._track_seq(q.id)
+
+    def _track_seq(self, qid: str) -> None:
+        m = _ID_RE.match(qid)
+        if m:
+            day, seq = m.group(1), int(m.group(2))
+            if seq > self._today_seq.get(day, 0):
+                self._today_seq[day] = seq
 
     def save(self) -> None:
+        self._dirty = True
+        if self._scheduler is None:
+            self.flush()
+            return
+        if self._save_job is not None:
+            self._scheduler.after_cancel(self._save_job)
+        self._save_job = self._scheduler.after(self.SAVE_DELAY_MS, self._on_save_timer)
+
+    def _on_save_timer(self) -> None:
+        self._save_job = None
+        try:
+            self.flush()
+        except OSError as exc:
+            # still dirty, so the next save or the close-time flush retries the write
+            messagebox.showerror('Save Error', f'Failed to write {self.path}: {exc}')
+
+    def flush(self) -> None:
+        if self._save_job is not None:
+            self._scheduler.after_cancel(self._save_job)
+            self._save_job = None
+        if not self._dirty:
+            return
         payload = {'questions': [q.to_json() for q in self.questions]}
+        data = memoryview(_json_dumps(payload))
         tmp = self.path.with_suffix('.tmp')
-        tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
-        tmp.replace(self.path)
+        # raw fd write: no text-layer buffering, and O_DSYNC (where available) so the
+        # data is on disk before the rename publishes it
+        fd = os.open(tmp, _WRITE_FLAGS, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, self.path)
+        self._dirty = False
 
     def next_id(self) -> str:
         today = datetime.utcnow().strftime('%Y%m%d')
-        seq = 1
-        pattern = re.compile(rf'^Q-{today}-(\d+)$')
-        for q in self.questions:
-            m = pattern.match(q.id)
-            if m:
-                seq = max(seq, int(m.group(1)) + 1)
+        seq = self._today_seq.get(today, 0) + 1
         return f'Q-{today}-{seq:03d}'
 
     def add(self, q: Question) -> None:
         self.questions.append(q)
+        self._by_id[q.id] = q
+        self._track_seq(q.id)
+        self._touch()
         self.save()
 
     def update(self, q: Question) -> None:
         # already mutated; just persist
-        q.updated = datetime.utcnow().strftime(ISO)
+        q.index_tags()
+        q.updated = _now_iso()
+        self._touch()
         self.save()
 
+    def _touch(self) -> None:
+        self.revision += 1
+        self._sorted_cache = None
+
     def get(self, qid: str) -> Optional[Question]:
-        for q in self.questions:
-            if q.id == qid:
-                return q
-        return None
+        return self._by_id.get(qid)
+
+    def sorted_questions(self) -> List[Question]:
+        """Questions ordered by priority then creation time (cached until the next mutation)."""
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(self.questions, key=lambda q: (_PRIORITY_RANK.get(q.priority, 99), q.created))
+        return self._sorted_cache
 
 class KnowledgeGUI(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
         self.title('Copilot Knowledge')
         self.geometry('1080x640')
-        self.store = Store(DATA_PATH)
+        self.store = Store(DATA_PATH, scheduler=self)
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
 
         self.filter_status = tk.StringVar(value='all')
         self.filter_tag = tk.StringVar()
         self.selected_id: Optional[str] = None
+        # rendered Treeview rows (iid -> values) and the (status, tag, revision) they reflect
+        self._row_values: Dict[str, tuple] = {}
+        self._list_key: Optional[tuple] = None
+        # paging: rows past _page_limit are kept in _pending_rows until scrolled into view
+        self._page_filter: Optional[tuple] = None
+        self._page_limit = _PAGE_SIZE
+        self._pending_rows: List[Question] = []
+        # (status, tag) -> filtered questions, valid for self._filter_cache_rev only
+        self._filter_cache: OrderedDict[tuple, List[Question]] = OrderedDict()
+        self._filter_cache_rev = -1
+        self._refresh_pending = False
 
         self._build_layout()
         self._refresh_list()
@@ -152,13 +331,13 @@ class KnowledgeGUI(tk.Tk):
         ttk.Label(fbar, text='Status').pack(side='left')
         status_cb = ttk.Combobox(fbar, values=['all'] + STATUSES, textvariable=self.filter_status, width=10, state='readonly')
         status_cb.pack(side='left', padx=4)
-        status_cb.bind('<<ComboboxSelected>>', lambda e: self._refresh_list())
+        status_cb.bind('<<ComboboxSelected>>', lambda e: self._schedule_refresh())
         ttk.Label(fbar, text='Tag').pack(side='left')
         tag_entry = ttk.Entry(fbar, textvariable=self.filter_tag, width=14)
         tag_entry.pack(side='left', padx=4)
-        tag_entry.bind('<Return>', lambda e: self._refresh_list())
+        tag_entry.bind('<Return>', lambda e: self._schedule_refresh())
         ttk.Button(fbar, text='Clear', command=self._clear_filters).pack(side='left')
-        ttk.Button(fbar, text='Refresh', command=self._refresh_list).pack(side='left', padx=4)
+        ttk.Button(fbar, text='Refresh', command=self._schedule_refresh).pack(side='left', padx=4)
 
         # List
         columns = ('id','title','status','priority','tags')
@@ -167,6 +346,7 @@ class KnowledgeGUI(tk.Tk):
             self.tree.heading(c, text=c.upper())
             self.tree.column(c, width=w, stretch=False)
         self.tree.pack(fill='y', expand=False, pady=4)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.tree.bind('<<TreeviewSelect>>', self._on_select)
 
         # Tabs
@@ -181,10 +361,18 @@ class KnowledgeGUI(tk.Tk):
         self._build_detail_tab()
         self._build_overview_tab()
 
+    def _on_close(self) -> None:
+        try:
+            self.store.flush()
+        except OSError as exc:
+            if not messagebox.askyesno('Save Error', f'Failed to write {self.store.path}: {exc}\n\nClose without saving?'):
+                return
+        self.destroy()
+
     def _clear_filters(self) -> None:
         self.filter_status.set('all')
         self.filter_tag.set('')
-        self._refresh_list()
+        self._schedule_refresh()
 
     # Create Tab
     def _build_create_tab(self) -> None:
@@ -268,19 +456,106 @@ class KnowledgeGUI(tk.Tk):
         ttk.Button(btns, text='Regenerate Overview', command=self._generate_overview).pack(side='left')
 
     # Helpers
+    def _schedule_refresh(self) -> None:
+        # coalesce refresh requests into one pass once the event queue is idle
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        self._refresh_list()
+
     def _refresh_list(self) -> None:
-        for i in self.tree.get_children():
-            self.tree.delete(i)
         status_filter = self.filter_status.get()
         tag_filter = self.filter_tag.get().strip().lower()
-        items = list(self.store.questions)
-        items.sort(key=lambda q: (PRIORITIES.index(q.priority) if q.priority in PRIORITIES else 99, q.created))
-        for q in items:
+        key = (status_filter, tag_filter, self.store.revision)
+        if key == self._list_key:
+            return
+        self._list_key = key
+        questions = self._filtered_questions(status_filter, tag_filter)
+        if (status_filter, tag_filter) != self._page_filter:
+            self._page_filter = (status_filter, tag_filter)
+            self._page_limit = _PAGE_SIZE
+        # only the first page(s) go into the tree; the rest is appended on scroll
+        self._pending_rows = questions[self._page_limit:]
+        rows = [(q.id, self._row_values_for(q)) for q in questions[:self._page_limit]]
+        # Diff against what is already rendered; each Treeview call is a Tcl round-trip.
+        wanted = {qid for qid, _ in rows}
+        stale = [qid for qid in self._row_values if qid not in wanted]
+        added = sum(1 for qid in wanted if qid not in self._row_values)
+        bulk = len(stale) + added > _BULK_UPDATE_ROWS
+        if bulk:
+            # unmapped, the tree does not relayout/redraw after every row change
+            self.tree.pack_forget()
+        if stale:
+            self.tree.delete(*stale)
+            for qid in stale:
+                del self._row_values[qid]
+        current = list(self.tree.get_children())
+        for index, (qid, values) in enumerate(rows):
+            prev = self._row_values.get(qid)
+            if prev is None:
+                self.tree.insert('', index, iid=qid, values=values)
+                current.insert(index, qid)
+            else:
+                if prev != values:
+                    self.tree.item(qid, values=values)
+                if current[index] != qid:
+                    self.tree.move(qid, '', index)
+                    current.remove(qid)
+                    current.insert(index, qid)
+            self._row_values[qid] = values
+        if bulk:
+            self.tree.pack(fill='y', expand=False, pady=4)
+
+    def _row_values_for(self, q: Question) -> tuple:
+        return (q.id, q.title[:40], q.status, q.priority, ','.join(q.tags))
+
+    def _on_tree_yscroll(self, first: str, last: str) -> None:
+        if self._pending_rows and float(last) >= 0.95:
+            self._load_more_rows()
+
+    def _load_more_rows(self) -> None:
+        chunk = self._pending_rows[:_PAGE_SIZE]
+        self._pending_rows = self._pending_rows[_PAGE_SIZE:]
+        self._page_limit += len(chunk)
+        for q in chunk:
+            if q.id in self._row_values:
+                continue
+            values = self._row_values_for(q)
+            self.tree.insert('', 'end', iid=q.id, values=values)
+            self._row_values[q.id] = values
+
+    def _filtered_questions(self, status_filter: str, tag_filter: str) -> List[Question]:
+        if self._filter_cache_rev != self.store.revision:
+            self._filter_cache.clear()
+            self._filter_cache_rev = self.store.revision
+        key = (status_filter, tag_filter)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            self._filter_cache.move_to_end(key)
+            return cached
+        # A result for a substring of this tag filter is a superset of ours; narrow it down.
+        base: Optional[List[Question]] = None
+        base_len = -1
+        for (status, tag), result in self._filter_cache.items():
+            if status == status_filter and len(tag) > base_len and tag in tag_filter:
+                base, base_len = result, len(tag)
+        if base is None:
+            base = self.store.sorted_questions()
+        result = []
+        for q in base:
             if status_filter != 'all' and q.status != status_filter:
                 continue
-            if tag_filter and not any(tag_filter in t.lower() for t in q.tags):
+            if tag_filter and tag_filter not in q.tags_lower:
                 continue
-            self.tree.insert('', 'end', iid=q.id, values=(q.id, q.title[:40], q.status, q.priority, ','.join(q.tags)))
+            result.append(q)
+        self._filter_cache[key] = result
+        if len(self._filter_cache) > _FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
+        return result
 
     def _on_select(self, _event) -> None:
         sel = self.tree.selection()
@@ -305,6 +580,7 @@ class KnowledgeGUI(tk.Tk):
         if not title:
             messagebox.showerror('Error', 'Title is required')
             return
+        now = _now_iso()
         q = Question(
             id=self.store.next_id(),
             title=title,
@@ -313,14 +589,12 @@ class KnowledgeGUI(tk.Tk):
             tags=[t.strip() for t in self.new_tags.get().split(',') if t.strip()],
             priority=self.new_priority.get(),
             status='open',
-            answer='',
-            answer_history=[],
-            created=datetime.utcnow().strftime(ISO),
-            updated=datetime.utcnow().strftime(ISO),
+            created=now,
+            updated=now,
         )
         self.store.add(q)
         self.new_title.set(''); self.new_tags.set(''); self.new_context.delete('1.0','end'); self.new_attempts.delete('1.0','end')
-        self._refresh_list()
+        self._schedule_refresh()
         messagebox.showinfo('Created', f'Created {q.id}')
 
     def _save_detail(self) -> None:
@@ -336,7 +610,7 @@ class KnowledgeGUI(tk.Tk):
         q.context = self.detail_context.get('1.0','end').strip()
         q.attempts = self.detail_attempts.get('1.0','end').strip()
         self.store.update(q)
-        self._refresh_list()
+        self._schedule_refresh()
         messagebox.showinfo('Saved', 'Changes saved')
 
     def _append_answer(self) -> None:
@@ -349,21 +623,17 @@ class KnowledgeGUI(tk.Tk):
         if not text:
             messagebox.showerror('Error', 'Answer text empty')
             return
-        entry = AnswerEntry(timestamp=datetime.utcnow().strftime(ISO), content=text)
+        entry = AnswerEntry(timestamp=_now_iso(), content=text)
         q.answer_history.append(entry)
-        if q.answer:
-            q.answer += '\n\n' + text
-        else:
-            q.answer = text
         if q.status == 'open':
             q.status = 'answered'
         self.store.update(q)
         self.detail_answer.delete('1.0','end')
-        self._refresh_list()
+        self._schedule_refresh()
         messagebox.showinfo('Updated', 'Answer appended')
 
     def _slug(self, text: str) -> str:
-        s = re.sub(r'[^a-zA-Z0-9]+', '-', text.lower()).strip('-')
+        s = _DASH_RUN_RE.sub('-', text.lower().translate(_SLUG_TABLE)).strip('-')
         return s[:40] or 'pattern'
 
     def _promote(self) -> None:
@@ -372,16 +642,17 @@ class KnowledgeGUI(tk.Tk):
         q = self.store.get(self.selected_id)
         if not q:
             return
-        if not q.answer:
+        if not q.answer_history:
             messagebox.showerror('Error', 'No answer to promote')
             return
         slug = self._slug(q.title)
+        prefix = f'auto-{slug}-'
+        with os.scandir(PATTERN_DIR) as entries:
+            existing = {e.name for e in entries if e.name.startswith(prefix)}
         seq = 1
-        while True:
-            fname = PATTERN_DIR / f'auto-{slug}-{seq:02d}.md'
-            if not fname.exists():
-                break
+        while f'{prefix}{seq:02d}.md' in existing:
             seq += 1
+        fname = PATTERN_DIR / f'{prefix}{seq:02d}.md'
         content = self._pattern_markdown(q)
         fname.write_text(content, encoding='utf-8')
         messagebox.showinfo('Promoted', f'Pattern written: {fname.name}')
@@ -401,15 +672,20 @@ class KnowledgeGUI(tk.Tk):
 
     def _build_overview_markdown(self) -> str:
         qs = list(self.store.questions)
-        now = datetime.utcnow().strftime(ISO)
-        open_q = [q for q in qs if q.status == 'open']
-        answered_q = [q for q in qs if q.status == 'answered']
-        # Tag freq
-        tag_freq = {}
+        now = _now_iso()
+        open_q: List[Question] = []
+        answered_q: List[Question] = []
+        tag_freq: Counter[str] = Counter()
         for q in qs:
-            for t in q.tags:
-                tag_freq[t] = tag_freq.get(t, 0) + 1
-        tag_lines = ['| Tag | Count |', '|-----|-------|'] + [f"| {k} | {v} |" for k, v in sorted(tag_freq.items(), key=lambda x: (-x[1], x[0]))[:10]]
+            if q.status == 'open':
+                open_q.append(q)
+            elif q.status == 'answered':
+                answered_q.append(q)
+            tag_freq.update(q.tags)
+        # top-N selections only need a bounded heap, not a full sort
+        top_tags = heapq.nsmallest(10, tag_freq.items(), key=lambda x: (-x[1], x[0]))
+        latest_answered = heapq.nlargest(10, answered_q, key=lambda q: q.updated)
+        tag_lines = ['| Tag | Count |', '|-----|-------|'] + [f"| {k} | {v} |" for k, v in top_tags]
         def short(q: Question) -> str:
             return f"- {q.id} [{q.priority}] {q.title} (tags: {', '.join(q.tags)})"
         lines = [
@@ -420,7 +696,7 @@ class KnowledgeGUI(tk.Tk):
             *(short(q) for q in open_q[:50]),
             "",
             f"## Recently Answered (latest 10)",
-            *(short(q) for q in sorted(answered_q, key=lambda q: q.updated, reverse=True)[:10]),
+            *(short(q) for q in latest_answered),
             "",
             "## Tag Frequency (Top 10)",
             *tag_lines,
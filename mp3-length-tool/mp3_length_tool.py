@@ -8,30 +8,95 @@ optionally time-stretched to reach a target duration.
 
 from __future__ import annotations
 
-import argparse
+import functools
+import math
+import os
 import shlex
 import shutil
+import string
 import subprocess
 import sys
-from dataclasses import dataclass
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import TYPE_CHECKING, BinaryIO, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import argparse
+
+try:  # optional; only used to clamp long segment lists in bulk
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
 
 TOLERANCE = 1e-3
 
+# Python opens its own descriptors non-inheritable (PEP 446), so on POSIX there is
+# nothing for close_fds to protect; skipping it avoids the close loop after fork
+# and lets subprocess use posix_spawn.  Windows keeps the default handle isolation.
+_CLOSE_FDS = os.name != "posix"
+
+# Segment lists at least this long are clamped with NumPy when it is installed.
+_NUMPY_SEGMENT_THRESHOLD = 16
+
+# MPEG audio Layer III header tables, indexed by the header's bitrate / sample-rate fields.
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+_MP3_SCAN_BYTES = 64 * 1024
+# Without a Xing/VBRI frame count, this many frames spread across the file
+# must share the first frame's bitrate before the CBR estimate is trusted.
+_MP3_CBR_SAMPLES = 8
+_MP3_CBR_SAMPLE_BYTES = 4096
+
+# Byte -> class table for _scan_clock_duration: digit values 0-9, then ":",
+# ".", and everything else.
+_CLOCK_COLON = 10
+_CLOCK_DOT = 11
+_CLOCK_BYTE_CLASS = bytes(
+    byte - 48 if 48 <= byte <= 57
+    else _CLOCK_COLON if byte == 58
+    else _CLOCK_DOT if byte == 46
+    else 12
+    for byte in range(256)
+)
+
+
+class _FrozenSlots:
+    """Copy and pickle support for frozen dataclasses with hand-written ``__slots__``.
+
+    The default slot state is restored through ``setattr``, which a frozen
+    dataclass rejects, so fields are set with ``object.__setattr__`` instead.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @dataclass(frozen=True)
-class SegmentSpec:
+class SegmentSpec(_FrozenSlots):
     """Definition of a segment to keep from the source audio."""
 
+    # Spelled out because ``dataclass(slots=True)`` needs Python 3.10.
+    __slots__ = ("start", "end")
+
     start: float
     end: float
 
 
 @dataclass(frozen=True)
-class SegmentResult:
+class SegmentResult(_FrozenSlots):
     """Details about a processed segment."""
 
+    __slots__ = ("start", "end", "duration")
+
     start: float
     end: float
     duration: float
@@ -51,6 +116,8 @@ class ProcessResult:
     tempo_factor: float
     ffmpeg_command: List[str]
     dry_run: bool
+    # Per-segment cuts run before ``ffmpeg_command`` joins them; empty for a single pass.
+    segment_commands: List[List[str]] = field(default_factory=list)
 
 
 def parse_duration(value: str, *, allow_zero: bool = False) -> float:
@@ -60,28 +127,12 @@ def parse_duration(value: str, *, allow_zero: bool = False) -> float:
     if not value:
         raise ValueError("Duration value cannot be empty.")
 
-    try:
+    if ":" not in value:
         seconds = float(value)
-    except ValueError:
-        parts = value.split(":")
-        if len(parts) > 3:
-            raise ValueError(f"Invalid duration format: {value}")
-        parsed: List[float] = []
-        for index, part in enumerate(parts):
-            part = part.strip()
-            if not part:
-                raise ValueError(f"Invalid duration segment: {value}")
-            if index == len(parts) - 1:
-                parsed.append(float(part))
-            else:
-                if "." in part:
-                    raise ValueError("Only the seconds segment may contain decimals.")
-                parsed.append(float(int(part)))
-        seconds = 0.0
-        multiplier = 1.0
-        for segment in reversed(parsed):
-            seconds += segment * multiplier
-            multiplier *= 60.0
+    else:
+        seconds = _scan_clock_duration(value)
+        if seconds is None:
+            seconds = _parse_clock_parts(value)
 
     if seconds < 0:
         raise ValueError("Duration must be non-negative.")
@@ -90,6 +141,75 @@ def parse_duration(value: str, *, allow_zero: bool = False) -> float:
     return seconds
 
 
+def _scan_clock_duration(value: str) -> Optional[float]:
+    """Single-pass parser for the canonical ``[hh:]mm:ss[.fff]`` form.
+
+    Works on the ASCII bytes of ``value`` and classifies each byte through
+    ``_CLOCK_BYTE_CLASS``.  Returns ``None`` for anything outside that grammar
+    (signs, exponents, inner whitespace, non-ASCII, ...) so
+    ``_parse_clock_parts`` can handle it and raise the usual error messages.
+    """
+
+    try:
+        buf = value.encode("ascii")
+    except UnicodeEncodeError:
+        return None
+
+    table = _CLOCK_BYTE_CLASS
+    hours = minutes = current = 0
+    colons = digits = 0
+    seconds_start = 0
+    has_dot = False
+    for index, kind in enumerate(buf.translate(table)):
+        if kind < 10:
+            current = current * 10 + kind
+            digits += 1
+        elif kind == _CLOCK_COLON:
+            if not digits or has_dot or colons == 2:
+                return None
+            hours, minutes = minutes, current
+            current = digits = 0
+            colons += 1
+            seconds_start = index + 1
+        elif kind == _CLOCK_DOT and not has_dot:
+            has_dot = True
+        else:
+            return None
+    if not digits:
+        return None
+    # float() on the seconds text keeps the result bit-identical to the general parser.
+    seconds = float(buf[seconds_start:]) if has_dot else float(current)
+    seconds += minutes * 60.0
+    if colons == 2:
+        seconds += hours * 3600.0
+    return seconds
+
+
+def _parse_clock_parts(value: str) -> float:
+    """General ``[[hh:]mm:]ss[.ms]`` parser used when the fast scan declines."""
+
+    parts = value.split(":")
+    if len(parts) > 3:
+        raise ValueError(f"Invalid duration format: {value}")
+    parsed: List[float] = []
+    for index, part in enumerate(parts):
+        part = part.strip()
+        if not part:
+            raise ValueError(f"Invalid duration segment: {value}")
+        if index == len(parts) - 1:
+            parsed.append(float(part))
+        else:
+            if "." in part:
+                raise ValueError("Only the seconds segment may contain decimals.")
+            parsed.append(float(int(part)))
+    seconds = 0.0
+    multiplier = 1.0
+    for segment in reversed(parsed):
+        seconds += segment * multiplier
+        multiplier *= 60.0
+    return seconds
+
+
 def parse_optional_duration(value: Optional[str], *, allow_zero: bool = False) -> Optional[float]:
     """Parse an optional duration string."""
 
@@ -108,15 +228,17 @@ def parse_segment_spec(text: str) -> SegmentSpec:
     if not text:
         raise ValueError("Segment value cannot be empty.")
 
-    if "+" in text:
-        start_text, length_text = text.split("+", 1)
-        start = parse_duration(start_text, allow_zero=True)
-        length = parse_duration(length_text, allow_zero=False)
+    # str.find scans in C: the first "+" wins, otherwise the first "-" after
+    # the opening character. parse_duration strips surrounding whitespace.
+    plus = text.find("+")
+    minus = text.find("-", 1) if plus < 0 else -1
+    if plus >= 0:
+        start = parse_duration(text[:plus], allow_zero=True)
+        length = parse_duration(text[plus + 1:], allow_zero=False)
         end = start + length
-    elif "-" in text:
-        start_text, end_text = text.split("-", 1)
-        start = parse_duration(start_text, allow_zero=True)
-        end = parse_duration(end_text, allow_zero=True)
+    elif minus >= 0:
+        start = parse_duration(text[:minus], allow_zero=True)
+        end = parse_duration(text[minus + 1:], allow_zero=True)
     else:
         raise ValueError(
             "Segment must be formatted as START-END or START+LENGTH"
@@ -128,8 +250,13 @@ def parse_segment_spec(text: str) -> SegmentSpec:
     return SegmentSpec(start=start, end=end)
 
 
+@functools.lru_cache(maxsize=32)
 def resolve_executable(candidate: str) -> str:
-    """Return an absolute path to an executable, if it exists."""
+    """Return an absolute path to an executable, if it exists.
+
+    Successful lookups are cached for the lifetime of the process; failures
+    are not, so installing a missing tool is picked up on the next call.
+    """
 
     path_candidate = Path(candidate).expanduser()
     if path_candidate.is_file():
@@ -157,15 +284,19 @@ def probe_duration(source: Path, ffprobe: str) -> float:
         completed = subprocess.run(
             cmd,
             check=True,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=_CLOSE_FDS,
         )
     except FileNotFoundError as exc:
         raise RuntimeError(f"ffprobe not found ({ffprobe}).") from exc
     except subprocess.CalledProcessError as exc:
-        raise RuntimeError(f"ffprobe failed: {exc.stderr.strip()}") from exc
+        stderr = exc.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"ffprobe failed: {stderr}") from exc
 
-    output = completed.stdout.strip()
+    # The output is a single number; decode just that instead of running both
+    # pipes through a text wrapper.
+    output = completed.stdout.decode("ascii", "replace").strip()
     try:
         return float(output)
     except ValueError as exc:
@@ -174,6 +305,132 @@ def probe_duration(source: Path, ffprobe: str) -> float:
         ) from exc
 
 
+def _parse_mp3_header(header: bytes) -> Optional[tuple[int, int, int, int, int]]:
+    """Decode a 4-byte Layer III frame header.
+
+    Returns ``(version, bitrate_kbps, sample_rate, padding, channel_mode)`` or
+    ``None`` when the bytes are not a valid Layer III header.
+    """
+
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrates = _MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2
+    return (
+        version,
+        bitrates[bitrate_index],
+        _MP3_SAMPLE_RATES[version][rate_index],
+        (header[2] >> 1) & 0x01,
+        header[3] >> 6,
+    )
+
+
+def _find_mp3_frame(
+    handle: BinaryIO, base: int, data: bytes
+) -> Optional[tuple[int, tuple[int, int, int, int, int]]]:
+    """Return the index and header of the first confirmed frame in ``data``.
+
+    ``data`` was read from ``handle`` at offset ``base``. A header only counts
+    when a second one with the same version and sample rate follows it, which
+    rules out false syncs in tags or audio payload.
+    """
+
+    index = data.find(b"\xff")
+    while 0 <= index <= len(data) - 4:
+        parsed = _parse_mp3_header(data[index:index + 4])
+        if parsed is not None:
+            version, bitrate, sample_rate = parsed[:3]
+            coefficient = 144 if version == 3 else 72
+            frame_length = coefficient * bitrate * 1000 // sample_rate + parsed[3]
+            following = data[index + frame_length:index + frame_length + 4]
+            if len(following) < 4:
+                # The next header lies past the scanned window; read it from the file.
+                handle.seek(base + index + frame_length)
+                following = handle.read(4)
+            confirm = _parse_mp3_header(following)
+            if confirm is not None and confirm[0] == version and confirm[2] == sample_rate:
+                return index, parsed
+        index = data.find(b"\xff", index + 1)
+    return None
+
+
+def probe_duration_mp3(source: Path) -> Optional[float]:
+    """Return the duration of an MP3 file read from its frame headers.
+
+    Uses the Xing/Info or VBRI frame count when present and otherwise
+    assumes a constant bitrate stream, after checking that frames sampled
+    across the file all share one bitrate. Returns ``None`` when the file
+    cannot be parsed so callers can fall back to ``probe_duration``.
+    """
+
+    try:
+        with open(source, "rb") as handle:
+            file_size = os.fstat(handle.fileno()).st_size
+            head = handle.read(10)
+            offset = 0
+            if len(head) == 10 and head[:3] == b"ID3":
+                # ID3v2 size is a 28-bit syncsafe integer, excluding the 10-byte header.
+                offset = 10 + (
+                    (head[6] & 0x7F) << 21
+                    | (head[7] & 0x7F) << 14
+                    | (head[8] & 0x7F) << 7
+                    | (head[9] & 0x7F)
+                )
+                if head[5] & 0x10:
+                    offset += 10  # footer present
+            handle.seek(offset)
+            data = handle.read(_MP3_SCAN_BYTES)
+            has_id3v1 = False
+            if file_size >= 128:
+                handle.seek(-128, os.SEEK_END)
+                has_id3v1 = handle.read(3) == b"TAG"
+
+            found = _find_mp3_frame(handle, offset, data)
+            if found is None:
+                return None
+            index, (version, bitrate, sample_rate, _, channel_mode) = found
+
+            samples_per_frame = 1152 if version == 3 else 576
+            mono = channel_mode == 3
+            if version == 3:
+                side_info = 17 if mono else 32
+            else:
+                side_info = 9 if mono else 17
+            xing = index + 4 + side_info
+            frames: Optional[int] = None
+            if data[xing:xing + 4] in (b"Xing", b"Info"):
+                flags = int.from_bytes(data[xing + 4:xing + 8], "big")
+                if flags & 0x01:
+                    frames = int.from_bytes(data[xing + 8:xing + 12], "big")
+            elif data[index + 36:index + 40] == b"VBRI":
+                frames = int.from_bytes(data[index + 50:index + 54], "big")
+
+            if frames:
+                return frames * samples_per_frame / sample_rate
+
+            audio_start = offset + index
+            audio_bytes = file_size - audio_start - (128 if has_id3v1 else 0)
+            if audio_bytes <= 0:
+                return None
+            # A VBR stream without a frame count would be misjudged from the first
+            # frame's bitrate alone, so check frames across the rest of the file.
+            for sample in range(1, _MP3_CBR_SAMPLES + 1):
+                base = audio_start + audio_bytes * sample // (_MP3_CBR_SAMPLES + 1)
+                handle.seek(base)
+                frame = _find_mp3_frame(handle, base, handle.read(_MP3_CBR_SAMPLE_BYTES))
+                if frame is None or frame[1][:3] != (version, bitrate, sample_rate):
+                    return None
+    except OSError:
+        return None
+
+    return audio_bytes * 8 / (bitrate * 1000)
+
+
 def build_atempo_chain(tempo: float) -> List[float]:
     """Create a list of ``atempo`` factors that multiply to ``tempo``."""
 
@@ -183,14 +440,28 @@ def build_atempo_chain(tempo: float) -> List[float]:
     if abs(tempo - 1.0) <= TOLERANCE:
         return [1.0]
 
+    # atempo accepts [0.5, 2.0]; split off whole 2x / 0.5x stages in closed form.
+    # Scaling by powers of two is exact, so this matches repeated halving/doubling.
+    upper = 2.0 + TOLERANCE
+    lower = 0.5 - TOLERANCE
     factors: List[float] = []
     remaining = tempo
-    while remaining > 2.0 + TOLERANCE:
-        factors.append(2.0)
-        remaining /= 2.0
-    while remaining < 0.5 - TOLERANCE:
-        factors.append(0.5)
-        remaining /= 0.5
+    if tempo > upper:
+        stages = max(math.ceil(math.log2(tempo / upper)), 1)
+        if tempo / 2.0 ** stages > upper:  # log2 rounded down at a boundary
+            stages += 1
+        elif stages > 1 and tempo / 2.0 ** (stages - 1) <= upper:
+            stages -= 1
+        factors = [2.0] * stages
+        remaining = tempo / 2.0 ** stages
+    elif tempo < lower:
+        stages = max(math.ceil(math.log2(lower / tempo)), 1)
+        if tempo * 2.0 ** stages < lower:
+            stages += 1
+        elif stages > 1 and tempo * 2.0 ** (stages - 1) >= lower:
+            stages -= 1
+        factors = [0.5] * stages
+        remaining = tempo * 2.0 ** stages
     if abs(remaining - 1.0) > TOLERANCE:
         factors.append(remaining)
     return factors or [1.0]
@@ -213,33 +484,399 @@ def format_duration(seconds: float) -> str:
     return base
 
 
+# Characters shlex.quote leaves unquoted; translating them away leaves "" for safe args.
+_SHELL_SAFE_STRIP = str.maketrans(
+    "", "", string.ascii_letters + string.digits + "@%+=:,./-_"
+)
+
+
 def format_command(cmd: Sequence[str]) -> str:
     """Return a printable shell command."""
 
-    return " ".join(shlex.quote(part) for part in cmd)
+    parts: List[str] = []
+    for part in cmd:
+        if part and not part.translate(_SHELL_SAFE_STRIP):
+            parts.append(part)
+        else:
+            parts.append(shlex.quote(part))
+    return " ".join(parts)
 
 
 def _normalise_segments(
     segments: Iterable[SegmentSpec],
     *,
     total_duration: float,
-) -> List[SegmentResult]:
-    """Clamp and validate segment definitions."""
+) -> Tuple[List[SegmentResult], float]:
+    """Clamp and validate segment definitions.
+
+    Returns the clamped segments together with their summed duration.
+    """
+
+    if np is not None:
+        segments = list(segments)
+        if len(segments) >= _NUMPY_SEGMENT_THRESHOLD:
+            return _normalise_segments_numpy(segments, total_duration=total_duration)
 
     results: List[SegmentResult] = []
+    total = 0.0
     for spec in segments:
         start = max(0.0, spec.start)
         end = max(start, min(spec.end, total_duration))
-        if end - start <= TOLERANCE:
+        duration = end - start
+        if duration <= TOLERANCE:
             raise ValueError(
                 "Segment duration must be greater than zero after clamping."
             )
         results.append(
-            SegmentResult(start=start, end=end, duration=end - start)
+            SegmentResult(start=start, end=end, duration=duration)
         )
+        total += duration
     if not results:
         raise ValueError("At least one segment must be provided.")
-    return results
+    return results, total
+
+
+def _normalise_segments_numpy(
+    segments: Sequence[SegmentSpec],
+    *,
+    total_duration: float,
+) -> Tuple[List[SegmentResult], float]:
+    """Vectorised ``_normalise_segments`` for long segment lists.
+
+    ``np.where`` mirrors the scalar ``max``/``min`` calls exactly (argument
+    order, ``-0.0`` and NaN included), so both paths return identical results.
+    """
+
+    bounds = np.array([(spec.start, spec.end) for spec in segments], dtype=np.float64)
+    starts = bounds[:, 0]
+    starts = np.where(starts > 0.0, starts, 0.0)
+    ends = bounds[:, 1]
+    ends = np.where(total_duration < ends, total_duration, ends)
+    ends = np.where(ends > starts, ends, starts)
+    with np.errstate(invalid="ignore"):  # inf - inf behaves like the scalar path
+        durations = ends - starts
+    if (durations <= TOLERANCE).any():
+        raise ValueError(
+            "Segment duration must be greater than zero after clamping."
+        )
+
+    results: List[SegmentResult] = []
+    total = 0.0
+    for start, end, duration in zip(starts.tolist(), ends.tolist(), durations.tolist()):
+        results.append(SegmentResult(start=start, end=end, duration=duration))
+        total += duration
+    return results, total
+
+
+_ATRIM_TEMPLATE = "[0:a]atrim=start=%.6f:end=%.6f,asetpts=PTS-STARTPTS[s%d]"
+_ATEMPO_TEMPLATE = "[%s]atempo=%.6f[%s]"
+
+
+def _build_filter_complex(
+    segments: Sequence[SegmentResult],
+    atempo_chain: Optional[Sequence[float]],
+) -> str:
+    """Return the ``atrim``/``concat``/``atempo`` graph ending in ``[out]``."""
+
+    count = len(segments)
+    filter_parts = [
+        _ATRIM_TEMPLATE % (segment.start, segment.end, index)
+        for index, segment in enumerate(segments)
+    ]
+    labels = "".join(["[s%d]" % index for index in range(count)])
+
+    if atempo_chain:
+        filter_parts.append("%sconcat=n=%d:v=0:a=1[aconcat]" % (labels, count))
+        current_label = "aconcat"
+        last = len(atempo_chain) - 1
+        for idx, factor in enumerate(atempo_chain):
+            next_label = "out" if idx == last else "tempo%d" % idx
+            filter_parts.append(_ATEMPO_TEMPLATE % (current_label, factor, next_label))
+            current_label = next_label
+    else:
+        filter_parts.append("%sconcat=n=%d:v=0:a=1[out]" % (labels, count))
+
+    return ";".join(filter_parts)
+
+
+def _thread_args(threads: int, *, filter_complex: bool) -> List[str]:
+    """Return ffmpeg threading options; ``threads == 0`` means one per CPU."""
+
+    filter_threads = str(threads or os.cpu_count() or 1)
+    args = ["-threads", str(threads), "-filter_threads", filter_threads]
+    if filter_complex:
+        args += ["-filter_complex_threads", filter_threads]
+    return args
+
+
+def _copy_segment_command(
+    ffmpeg_path: str,
+    input_path: str,
+    segment: SegmentResult,
+    output_path: str,
+) -> List[str]:
+    """Return an ffmpeg command that cuts ``segment`` without re-encoding."""
+
+    return [
+        ffmpeg_path,
+        "-hide_banner",
+        "-y",
+        "-ss",
+        f"{segment.start:.6f}",
+        "-to",
+        f"{segment.end:.6f}",
+        "-i",
+        input_path,
+        "-vn",
+        "-c:a",
+        "copy",
+        output_path,
+    ]
+
+
+def _copy_segment(
+    ffmpeg_path: str,
+    input_path: str,
+    segment: SegmentResult,
+    output_path: str,
+) -> Optional[Tuple[List[List[str]], List[str]]]:
+    """Cut ``segment`` with stream copy.
+
+    Returns no segment commands and the ffmpeg command, or ``None`` if the copy
+    failed (e.g. the input is not MP3) and the caller should fall back to the
+    filter graph.
+    """
+
+    copy_cmd = _copy_segment_command(ffmpeg_path, input_path, segment, output_path)
+    try:
+        completed = subprocess.run(
+            copy_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=_CLOSE_FDS,
+        )
+    except OSError:
+        return None
+    if completed.returncode != 0:
+        return None
+    return [], copy_cmd
+
+
+def _wav_part(tmp_dir: Path, index: int) -> Path:
+    return tmp_dir / f"segment{index:04d}.wav"
+
+
+def _wav_segment_command(
+    ffmpeg_path: str,
+    input_path: str,
+    segment: SegmentResult,
+    tmp_dir: Path,
+    index: int,
+) -> List[str]:
+    """Return an ffmpeg command that decodes ``segment`` to a WAV in ``tmp_dir``.
+
+    PCM keeps the later tempo/encode pass from stacking MP3 generation losses.
+    """
+
+    return [
+        ffmpeg_path,
+        "-hide_banner",
+        "-y",
+        "-ss",
+        f"{segment.start:.6f}",
+        "-to",
+        f"{segment.end:.6f}",
+        "-i",
+        input_path,
+        "-vn",
+        "-c:a",
+        "pcm_s16le",
+        str(_wav_part(tmp_dir, index)),
+    ]
+
+
+def _concat_command(
+    ffmpeg_path: str,
+    tmp_dir: Path,
+    output_path: str,
+    *,
+    atempo_chain: Sequence[float],
+    threads: int,
+) -> List[str]:
+    """Return the ffmpeg command that joins the WAV pieces listed in ``tmp_dir``."""
+
+    return [
+        ffmpeg_path,
+        "-hide_banner",
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(tmp_dir / "concat.txt"),
+        "-filter:a",
+        ",".join(f"atempo={factor:.6f}" for factor in atempo_chain),
+        "-c:a",
+        "libmp3lame",
+        *_thread_args(threads, filter_complex=False),
+        output_path,
+    ]
+
+
+def _run_quiet(cmd: Sequence[str]) -> bool:
+    """Run ``cmd`` with its output captured; return whether it succeeded."""
+
+    try:
+        completed = subprocess.run(cmd, capture_output=True, close_fds=_CLOSE_FDS)
+    except OSError:
+        return False
+    return completed.returncode == 0
+
+
+def _pipe_segment_command(
+    ffmpeg_path: str,
+    input_path: str,
+    segment: SegmentResult,
+) -> List[str]:
+    """Return an ffmpeg command that writes the raw MP3 frames of ``segment`` to stdout."""
+
+    cmd = _copy_segment_command(ffmpeg_path, input_path, segment, "pipe:1")
+    # Bare frames only: no ID3 tag or Xing header in the middle of the joined stream.
+    cmd[-1:-1] = ["-f", "mp3", "-write_xing", "0", "-id3v2_version", "0"]
+    return cmd
+
+
+def _pipe_join_command(ffmpeg_path: str, output_path: str) -> List[str]:
+    return [
+        ffmpeg_path,
+        "-hide_banner",
+        "-y",
+        "-f",
+        "mp3",
+        "-i",
+        "pipe:0",
+        "-c",
+        "copy",
+        output_path,
+    ]
+
+
+def _read_copied_segment(cmd: Sequence[str]) -> Optional[bytes]:
+    """Run a ``_pipe_segment_command`` and return its frames, or ``None`` on failure."""
+
+    try:
+        completed = subprocess.run(cmd, capture_output=True, close_fds=_CLOSE_FDS)
+    except OSError:
+        return None
+    return completed.stdout if completed.returncode == 0 else None
+
+
+def _pipe_copy_segments(
+    ffmpeg_path: str,
+    input_path: str,
+    segments: Sequence[SegmentResult],
+    output_path: str,
+    *,
+    jobs: int,
+) -> Optional[Tuple[List[List[str]], List[str]]]:
+    """Cut ``segments`` in parallel with stream copy and join them through a pipe.
+
+    Each cut writes its MP3 frames to stdout; the frames are fed in order to a
+    single muxing ffmpeg on stdin, so nothing touches the disk in between.
+    Returns the segment commands and the final ffmpeg command, or ``None`` if
+    any step failed and the caller should fall back to the filter graph.
+    """
+
+    segment_cmds = [
+        _pipe_segment_command(ffmpeg_path, input_path, segment) for segment in segments
+    ]
+    join_cmd = _pipe_join_command(ffmpeg_path, output_path)
+    try:
+        joiner = subprocess.Popen(
+            join_cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=_CLOSE_FDS,
+        )
+    except OSError:
+        return None
+
+    ok = True
+    workers = max(1, min(len(segments), jobs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so each piece is written as soon as
+        # it and everything before it are ready.
+        for frames in pool.map(_read_copied_segment, segment_cmds):
+            if frames is None:
+                ok = False
+                break
+            try:
+                joiner.stdin.write(frames)
+            except OSError:
+                ok = False
+                break
+    if not ok:
+        joiner.kill()
+    try:
+        joiner.stdin.close()
+    except OSError:
+        pass
+    if joiner.wait() != 0 or not ok:
+        return None
+    return segment_cmds, join_cmd
+
+
+def _concat_segments(
+    ffmpeg_path: str,
+    input_path: str,
+    segments: Sequence[SegmentResult],
+    output_path: str,
+    *,
+    atempo_chain: Sequence[float],
+    jobs: int,
+    threads: int = 0,
+) -> Optional[Tuple[List[List[str]], List[str]]]:
+    """Decode ``segments`` in parallel and time-stretch them in one final pass.
+
+    The WAV pieces are spliced with the concat demuxer and the tempo change is
+    applied while encoding the joined result.  Decoded PCM is too large to
+    buffer in memory for long inputs, so this path keeps temporary files.
+    Returns the segment commands and the final ffmpeg command, or ``None`` if
+    any step failed and the caller should fall back to the filter graph.
+    """
+
+    with tempfile.TemporaryDirectory(prefix="mp3_length_tool_") as tmpdir:
+        tmp_path = Path(tmpdir)
+        segment_cmds = [
+            _wav_segment_command(ffmpeg_path, input_path, segment, tmp_path, index)
+            for index, segment in enumerate(segments)
+        ]
+        workers = max(1, min(len(segments), jobs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            if not all(pool.map(_run_quiet, segment_cmds)):
+                return None
+
+        (tmp_path / "concat.txt").write_text(
+            "".join(
+                "file '{}'\n".format(
+                    _wav_part(tmp_path, index).as_posix().replace("'", "'\\''")
+                )
+                for index in range(len(segments))
+            ),
+            encoding="utf-8",
+        )
+        concat_cmd = _concat_command(
+            ffmpeg_path,
+            tmp_path,
+            output_path,
+            atempo_chain=atempo_chain,
+            threads=threads,
+        )
+        if not _run_quiet(concat_cmd):
+            return None
+        return segment_cmds, concat_cmd
 
 
 def process_audio(
@@ -255,39 +892,65 @@ def process_audio(
     dry_run: bool = False,
     ffmpeg: str = "ffmpeg",
     ffprobe: str = "ffprobe",
+    jobs: Optional[int] = None,
+    threads: int = 0,
 ) -> ProcessResult:
-    """Run the audio processing pipeline and return a summary."""
+    """Run the audio processing pipeline and return a summary.
+
+    ``jobs`` caps how many segments are cut concurrently (default: CPU count).
+    ``threads`` is passed to ffmpeg's encoder and filter threading (0 = auto).
+    """
 
     input_path = Path(input_path).expanduser()
     output_path = Path(output_path).expanduser()
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file does not exist: {input_path}")
+    input_str = os.fspath(input_path)
+    output_str = os.fspath(output_path)
 
+    # One stat per path answers "exists" and "same file" (device + inode)
+    # without resolving every path component.
     try:
-        if input_path.resolve() == output_path.resolve():
-            raise ValueError("Input and output paths must be different.")
-    except FileNotFoundError:
-        # ``output_path`` does not exist yet; safe to ignore.
-        pass
+        input_stat = os.stat(input_str)
+    except OSError:
+        # Also covers a file used as a directory and unreadable parents,
+        # which Path.exists() reported the same way.
+        raise FileNotFoundError(f"Input file does not exist: {input_path}") from None
+    try:
+        output_stat: Optional[os.stat_result] = os.stat(output_str)
+    except OSError:
+        output_stat = None
 
-    if output_path.exists() and not overwrite:
-        raise FileExistsError(
-            f"Output file already exists: {output_path} (use --overwrite to replace it)"
-        )
+    if output_stat is not None:
+        if os.path.samestat(input_stat, output_stat):
+            raise ValueError("Input and output paths must be different.")
+        if not overwrite:
+            raise FileExistsError(
+                f"Output file already exists: {output_path} (use --overwrite to replace it)"
+            )
 
     parent_dir = output_path.parent
-    if not parent_dir.exists():
+    if output_stat is None and not parent_dir.exists():
         if dry_run:
             raise FileNotFoundError(
                 f"Output directory does not exist: {parent_dir}"
             )
         parent_dir.mkdir(parents=True, exist_ok=True)
 
-    ffmpeg_path = resolve_executable(ffmpeg)
-    ffprobe_path = resolve_executable(ffprobe)
+    # PATH lookups and the input probe are independent; overlap their latency.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        ffmpeg_future = pool.submit(resolve_executable, ffmpeg)
+        ffprobe_future = pool.submit(resolve_executable, ffprobe)
+
+        def probe_input() -> float:
+            duration = probe_duration_mp3(input_path)
+            if duration is None:
+                duration = probe_duration(input_path, ffprobe_future.result())
+            return duration
 
-    total_duration = probe_duration(input_path, ffprobe_path)
+        duration_future = pool.submit(probe_input)
+        ffmpeg_path = ffmpeg_future.result()
+        ffprobe_path = ffprobe_future.result()
+        total_duration = duration_future.result()
 
     segment_specs: List[SegmentSpec] = []
     if segments is not None:
@@ -304,9 +967,10 @@ def process_audio(
             end = total_duration
         segment_specs = [SegmentSpec(start=start, end=end)]
 
-    normalised_segments = _normalise_segments(segment_specs, total_duration=total_duration)
+    normalised_segments, total_segment_duration = _normalise_segments(
+        segment_specs, total_duration=total_duration
+    )
 
-    total_segment_duration = sum(segment.duration for segment in normalised_segments)
     if total_segment_duration <= TOLERANCE:
         raise ValueError("Total segment duration must be positive.")
 
@@ -316,49 +980,23 @@ def process_audio(
         tempo_factor = total_segment_duration / target_duration
         if tempo_factor <= 0:
             raise ValueError("Computed tempo factor is invalid.")
+        atempo_chain = build_atempo_chain(tempo_factor)
+        apply_tempo = len(atempo_chain) > 1 or abs(atempo_chain[0] - 1.0) > TOLERANCE
     else:
         tempo_factor = 1.0
+        atempo_chain = [1.0]
+        apply_tempo = False
 
-    atempo_chain = build_atempo_chain(tempo_factor)
-    apply_tempo = target_duration is not None and (
-        len(atempo_chain) > 1 or abs(atempo_chain[0] - 1.0) > TOLERANCE
+    filter_complex = _build_filter_complex(
+        normalised_segments,
+        atempo_chain if apply_tempo else None,
     )
-
-    filter_parts: List[str] = []
-    labels: List[str] = []
-    for index, segment in enumerate(normalised_segments):
-        label = f"s{index}"
-        filter_parts.append(
-            f"[0:a]atrim=start={segment.start:.6f}:end={segment.end:.6f},"
-            f"asetpts=PTS-STARTPTS[{label}]"
-        )
-        labels.append(f"[{label}]")
-
-    concat_label = "aconcat"
-    concat_part = "".join(labels) + f"concat=n={len(labels)}:v=0:a=1[{concat_label}]"
-    if apply_tempo:
-        filter_parts.append(concat_part)
-        current_label = concat_label
-        for idx, factor in enumerate(atempo_chain):
-            is_last = idx == len(atempo_chain) - 1
-            next_label = "out" if is_last else f"tempo{idx}"
-            filter_parts.append(
-                f"[{current_label}]atempo={factor:.6f}[{next_label}]"
-            )
-            current_label = next_label
-    else:
-        filter_parts.append(
-            "".join(labels) + f"concat=n={len(labels)}:v=0:a=1[out]"
-        )
-
-    filter_complex = ";".join(filter_parts)
-
     ffmpeg_cmd = [
         ffmpeg_path,
         "-hide_banner",
         "-y",
         "-i",
-        str(input_path),
+        input_str,
         "-filter_complex",
         filter_complex,
         "-map",
@@ -366,10 +1004,47 @@ def process_audio(
         "-vn",
         "-c:a",
         "libmp3lame",
-        str(output_path),
+        *_thread_args(threads, filter_complex=True),
+        output_str,
     ]
 
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    # A plain single cut copies the MP3 frames instead of re-encoding.  Several
+    # segments are cut in parallel and joined outside the filter graph: copied
+    # frames piped into one muxer when the tempo is unchanged, WAV pieces plus
+    # a single atempo/encode pass otherwise.  The filter graph above stays as
+    # the fallback when any step fails (e.g. a non-MP3 input cannot be copied).
+    stream_copy = len(normalised_segments) == 1 and not apply_tempo
+    pipe_copy = len(normalised_segments) > 1 and not apply_tempo
+    wav_concat = len(normalised_segments) > 1 and apply_tempo and jobs > 1
+    segment_cmds: List[List[str]] = []
+
     if dry_run:
+        # Report the plan a real run tries first, not its filter-graph fallback.
+        if stream_copy:
+            ffmpeg_cmd = _copy_segment_command(
+                ffmpeg_path, input_str, normalised_segments[0], output_str
+            )
+        elif pipe_copy:
+            segment_cmds = [
+                _pipe_segment_command(ffmpeg_path, input_str, segment)
+                for segment in normalised_segments
+            ]
+            ffmpeg_cmd = _pipe_join_command(ffmpeg_path, output_str)
+        elif wav_concat:
+            tmp_path = Path("<tmpdir>")
+            segment_cmds = [
+                _wav_segment_command(ffmpeg_path, input_str, segment, tmp_path, index)
+                for index, segment in enumerate(normalised_segments)
+            ]
+            ffmpeg_cmd = _concat_command(
+                ffmpeg_path,
+                tmp_path,
+                output_str,
+                atempo_chain=atempo_chain,
+                threads=threads,
+            )
         return ProcessResult(
             input_path=input_path,
             output_path=output_path,
@@ -381,20 +1056,44 @@ def process_audio(
             tempo_factor=tempo_factor,
             ffmpeg_command=ffmpeg_cmd,
             dry_run=True,
+            segment_commands=segment_cmds,
         )
 
-    try:
-        subprocess.run(ffmpeg_cmd, check=True)
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(f"ffmpeg failed with exit code {exc.returncode}") from exc
-    except FileNotFoundError:
-        raise ValueError(f"Unable to locate ffmpeg executable: {ffmpeg_path}")
+    plan: Optional[Tuple[List[List[str]], List[str]]] = None
+    if stream_copy:
+        plan = _copy_segment(ffmpeg_path, input_str, normalised_segments[0], output_str)
+    elif pipe_copy:
+        plan = _pipe_copy_segments(
+            ffmpeg_path, input_str, normalised_segments, output_str, jobs=jobs
+        )
+    elif wav_concat:
+        plan = _concat_segments(
+            ffmpeg_path,
+            input_str,
+            normalised_segments,
+            output_str,
+            atempo_chain=atempo_chain,
+            jobs=jobs,
+            threads=threads,
+        )
 
-    try:
-        new_duration = probe_duration(output_path, ffprobe_path)
-    except RuntimeError as exc:
-        sys.stderr.write(f"Warning: {exc}\n")
-        new_duration = None
+    if plan is not None:
+        segment_cmds, ffmpeg_cmd = plan
+    else:
+        try:
+            subprocess.run(ffmpeg_cmd, check=True, close_fds=_CLOSE_FDS)
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f"ffmpeg failed with exit code {exc.returncode}") from exc
+        except FileNotFoundError:
+            raise ValueError(f"Unable to locate ffmpeg executable: {ffmpeg_path}")
+
+    new_duration = probe_duration_mp3(output_path)
+    if new_duration is None:
+        try:
+            new_duration = probe_duration(output_path, ffprobe_path)
+        except RuntimeError as exc:
+            sys.stderr.write(f"Warning: {exc}\n")
+            new_duration = None
 
     return ProcessResult(
         input_path=input_path,
@@ -407,9 +1106,25 @@ def process_audio(
         tempo_factor=tempo_factor,
         ffmpeg_command=ffmpeg_cmd,
         dry_run=False,
+        segment_commands=segment_cmds,
     )
 
 
+def format_plan(result: ProcessResult) -> str:
+    """Return every ffmpeg command behind ``result`` as printable shell text.
+
+    Piped segment cuts are shown as a brace group feeding the joining command.
+    """
+
+    final = format_command(result.ffmpeg_command)
+    if not result.segment_commands:
+        return final
+    lines = [format_command(cmd) for cmd in result.segment_commands]
+    if result.segment_commands[0][-1] == "pipe:1":
+        return "{ " + "\n  ".join(lines) + "\n} | " + final
+    return "\n".join(lines + [final])
+
+
 def _print_result(result: ProcessResult) -> None:
     """Pretty-print a ``ProcessResult`` to stdout."""
 
@@ -459,7 +1174,17 @@ def _print_result(result: ProcessResult) -> None:
     print(f"Output written to: {result.output_path}")
 
 
-def main() -> int:
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Return the CLI parser, built once per process.
+
+    Batch drivers that call ``main`` repeatedly reuse the same parser.
+    ``argparse`` is imported here so library users of ``process_audio`` never
+    pay for it.
+    """
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Trim one or more segments from an MP3, concatenate them, and optionally "
@@ -504,6 +1229,19 @@ def main() -> int:
         action="store_true",
         help="Print the ffmpeg command without executing it",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of segments to cut in parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=0,
+        help="ffmpeg encoder/filter threads; 0 picks one per CPU (default: %(default)s)",
+    )
     parser.add_argument(
         "--ffmpeg",
         default="ffmpeg",
@@ -515,10 +1253,20 @@ def main() -> int:
         help="Path to the ffprobe executable (default: %(default)s)",
     )
 
+    return parser
+
+
+def main() -> int:
+    parser = _build_parser()
     args = parser.parse_args()
 
     target_seconds = parse_optional_duration(args.target_duration)
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.threads < 0:
+        parser.error("--threads must not be negative")
+
     segment_specs: Optional[List[SegmentSpec]] = None
     if args.segment:
         segment_specs = []
@@ -574,6 +1322,8 @@ def main() -> int:
             dry_run=args.dry_run,
             ffmpeg=args.ffmpeg,
             ffprobe=args.ffprobe,
+            jobs=args.jobs,
+            threads=args.threads,
         )
     except FileNotFoundError as exc:
         parser.error(str(exc))
@@ -586,7 +1336,7 @@ def main() -> int:
         return 1
 
     if result.dry_run:
-        print(format_command(result.ffmpeg_command))
+        print(format_plan(result))
         return 0
 
     _print_result(result)
@@ -8,28 +8,82 @@ reordering, and exporting through the shared processing pipeline.
 """
 from __future__ import annotations
 
+import os
 import subprocess
 import threading
 import tkinter as tk
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from mp3_length_tool import (
     TOLERANCE,
     ProcessResult,
     SegmentSpec,
-    format_command,
     format_duration,
+    format_plan,
     parse_duration,
     process_audio,
     probe_duration,
     resolve_executable,
 )
 
+try:  # optional; replays cached previews from memory instead of spawning ffplay
+    import simpleaudio
+except ImportError:  # pragma: no cover - depends on the environment
+    simpleaudio = None
+
 DEFAULT_PREVIEW_SECONDS = 15.0
 
+# Same trade-off as the CLI: skip the fd sweep on POSIX so spawning can take the
+# posix_spawn path. On Windows, keep preview helpers from flashing a console window.
+_CLOSE_FDS = os.name != "posix"
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Timeline regions that can be marked dirty; flushed together on the next idle tick.
+DIRTY_SELECTION = 1
+DIRTY_SEGMENTS = 2
+DIRTY_MARKER = 4
+DIRTY_ALL = DIRTY_SELECTION | DIRTY_SEGMENTS | DIRTY_MARKER
+
+# Entry edits arriving within this window (tab-through, Return + FocusOut) apply once.
+ENTRY_DEBOUNCE_MS = 80
+# Typing in the playback-start entry moves the marker once the keys pause this long.
+TYPING_DEBOUNCE_MS = 150
+
+# Handle drags apply the latest pointer position at most once per frame (~60 Hz).
+DRAG_FLUSH_MS = 16
+
+# Probed durations kept per (path, mtime_ns, size); oldest entries are evicted first.
+DURATION_CACHE_SIZE = 32
+
+DurationKey = Tuple[str, int, int]
+
+# Decoded preview clips kept in memory (simpleaudio only); longer previews stream via ffplay.
+PREVIEW_CACHE_SIZE = 3
+PREVIEW_CACHE_MAX_SECONDS = 60.0
+PREVIEW_SAMPLE_RATE = 44100
+PREVIEW_CHANNELS = 2
+
+# How often the event loop checks whether the preview player has exited.
+PLAYBACK_POLL_MS = 100
+
+# Above this many segments the markers are rasterised into one image instead
+# of one canvas rectangle each.
+SEGMENT_IMAGE_THRESHOLD = 64
+SEGMENT_MARKER_COLOR = "#cfe2ff"
+
+# Ctrl+wheel zooms the timeline around the pointer by this factor per notch;
+# the plain wheel pans by PAN_FRACTION of the visible span.
+ZOOM_STEP = 1.25
+MAX_ZOOM = 64.0
+PAN_FRACTION = 0.1
+
+# Canvas tag shared by the playback line and its arrow so they move as one.
+PLAYBACK_MARKER_TAG = "playback_marker"
+
 
 @dataclass(frozen=True)
 class ProcessRequest:
@@ -42,14 +96,62 @@ class ProcessRequest:
     overwrite: bool
     dry_run: bool
 
+@lru_cache(maxsize=4096)
+def _format_duration_ms(milliseconds: int) -> str:
+    return format_duration(milliseconds / 1000.0)
+
+
+def _format_time(seconds: float) -> str:
+    """format_duration memoised at the millisecond resolution it displays."""
+    return _format_duration_ms(int(round(seconds * 1000)))
+
+
+@lru_cache(maxsize=1024)
+def _parse_duration_outcome(text: str, allow_zero: bool) -> Tuple[float, Optional[str]]:
+    # Failures are cached as their message so a held-down invalid key is not re-parsed.
+    try:
+        return parse_duration(text, allow_zero=allow_zero), None
+    except ValueError as exc:
+        return 0.0, str(exc)
+
+
+def _parse_duration_cached(text: str, *, allow_zero: bool = False) -> float:
+    value, error = _parse_duration_outcome(text, allow_zero)
+    if error is not None:
+        raise ValueError(error)
+    return value
+
+
+# One line of the processing summary per kept segment.
+_SEGMENT_LINE_TEMPLATE = "  %2d: %s -> %s (%.3f 秒)"
+
+
 def _parse_optional(value: str, *, allow_zero: bool, default: Optional[float]) -> Optional[float]:
     text = value.strip()
     if not text:
         return default
-    return parse_duration(text, allow_zero=allow_zero)
+    return _parse_duration_cached(text, allow_zero=allow_zero)
+
+
+class _BufferPlayback:
+    """Popen-like handle for an in-memory preview, so play_process can hold either kind."""
+
+    def __init__(self, play_object: "simpleaudio.PlayObject") -> None:
+        self._play_object = play_object
+
+    def poll(self) -> Optional[int]:
+        return None if self._play_object.is_playing() else 0
+
+    def terminate(self) -> None:
+        self._play_object.stop()
+
+    kill = terminate
 
 
 class Mp3LengthToolApp(tk.Tk):
+    # Theme colours per (Tcl interpreter, style); "" when the theme defines none.
+    _bg_cache: Dict[Tuple[int, str], str] = {}
+
     def __init__(self) -> None:
         super().__init__()
         self.title("MP3 長さ調整ツール")
@@ -59,6 +161,8 @@ class Mp3LengthToolApp(tk.Tk):
         self.trim_start_seconds: float = 0.0
         self.trim_end_seconds: float = 0.0
         self.trim_end_explicit: bool = False
+        # (start, end, end_explicit, total_duration) as last applied by _set_trim_range.
+        self._applied_trim: Optional[Tuple[float, float, bool, Optional[float]]] = None
 
         self.input_var = tk.StringVar()
         self.output_var = tk.StringVar()
@@ -76,24 +180,72 @@ class Mp3LengthToolApp(tk.Tk):
         self.timeline_height = 56
         self.timeline_padding = 18
         self.timeline_handle_half = 6
+        # Pixel/second factors for the current duration and width; see _recompute_timeline_scale.
+        self._usable_px = 0.0
+        self._px_per_sec = 0.0
+        self._sec_per_px = 0.0
+        # Zoom factor and the time shown at the left edge; reset when the duration changes.
+        self._zoom = 1.0
+        self._scroll_t0 = 0.0
+        self._scale_total: Optional[float] = None
         self._active_handle: Optional[str] = None
+        self._pending_drag_seconds: Optional[float] = None
+        self._drag_after_id: Optional[str] = None
 
-        self.play_process: Optional[subprocess.Popen] = None
-        self.playback_thread: Optional[threading.Thread] = None
+        self.play_process: Optional[Union[subprocess.Popen, _BufferPlayback]] = None
+        self._playback_poll_id: Optional[str] = None
 
         self.segments: List[SegmentSpec] = []
+        # Listbox rows as last rendered and the running kept-length total, so
+        # edits touch only the rows that changed.
+        self._segment_rows: List[str] = []
+        self._segments_total = 0.0
+        # Bumped by _segments_changed; lets the summary tell whether the list moved.
+        self._segments_version = 0
+        self._last_summary_key: Optional[tuple] = None
 
         self.playback_start_seconds: float = 0.0
-        self.playback_start_var = tk.StringVar(value=format_duration(0.0))
+        self.playback_start_var = tk.StringVar(value=_format_time(0.0))
         self.preview_length_var = tk.StringVar(value="15")
+        # Last (text, end_explicit, end, total, start) key and the duration it produced.
+        self._preview_duration_key: Optional[tuple] = None
+        self._preview_duration_value = 0.0
 
         self.segment_marker_ids: List[int] = []
+        self._visible_marker_count = 0
+        self._segment_image: Optional[tk.PhotoImage] = None
+        self._segment_image_id: Optional[int] = None
         self.playback_marker_id: Optional[int] = None
         self.playback_marker_text_id: Optional[int] = None
+        self._last_marker_x: Optional[int] = None
+
+        # Millisecond values the handle labels last showed; -1 forces a refresh.
+        self._last_start_ms = -1
+        self._last_end_ms = -1
+
+        self._dirty_mask = 0
+        self._flush_scheduled = False
+        # Geometry and options queued by the redraw helpers, applied once per item.
+        self._pending_coords: Dict[int, Tuple[float, ...]] = {}
+        self._pending_cfg: Dict[int, Dict[str, object]] = {}
+        # False while the window is iconified; dirty regions wait for <Map>.
+        self._canvas_visible = True
+
+        self._debounce_pending: Dict[str, Tuple[str, Callable[[], object]]] = {}
+        # Text each entry last showed for a validated value; re-applying it is a no-op.
+        self._entry_synced_text: Dict[str, str] = {}
+        self._duration_cache: Dict[DurationKey, float] = {}
+        # Raw PCM per (path, mtime_ns, start, length), least recently played first.
+        self._preview_cache: Dict[Tuple[str, int, float, float], bytes] = {}
+        # Keys whose PCM a background decode is still producing.
+        self._preview_decoding: Set[Tuple[str, int, float, float]] = set()
 
         self._build_ui()
         self.processing_thread: Optional[threading.Thread] = None
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Root bindings also see <Map> from child widgets such as the timeline canvas.
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Unmap>", self._on_unmap, add="+")
         self._set_trim_range(0.0, None, end_explicit=False)
         self._set_playback_start(0.0, update_entry=False, update_marker=True)
     def _build_ui(self) -> None:
@@ -105,14 +257,30 @@ class Mp3LengthToolApp(tk.Tk):
         row = 0
         row = self._build_file_inputs(frame, padding, row)
         row = self._build_trim_section(frame, row)
+
+        # The segment list and run options are built once an input path is
+        # entered; until then an empty frame holds their grid rows.
+        self._segments_ui_built = False
+        self._deferred_section = (frame, row)
+        self._segments_placeholder = ttk.Frame(frame)
+        self._segments_placeholder.grid(row=row, column=0, columnspan=3)
+        self.input_var.trace_add("write", lambda *_: self._ensure_segments_ui_built())
+        self._build_status_bar(frame, row + 3)
+
+    def _ensure_segments_ui_built(self) -> None:
+        if self._segments_ui_built:
+            return
+        self._segments_ui_built = True
+        frame, row = self._deferred_section
+        self._segments_placeholder.destroy()
         row = self._build_segments_section(frame, row)
-        row = self._build_options_section(frame, row)
-        self._build_status_bar(frame, row)
+        self._build_options_section(frame, row)
 
     def _build_file_inputs(self, frame: ttk.Frame, padding: dict[str, int], row: int) -> int:
         ttk.Label(frame, text="入力ファイル").grid(row=row, column=0, sticky="w", **padding)
         ttk.Entry(frame, textvariable=self.input_var, width=48).grid(row=row, column=1, sticky="ew", **padding)
-        ttk.Button(frame, text="参照...", command=self._select_input).grid(row=row, column=2, **padding)
+        self.input_button = ttk.Button(frame, text="参照...", command=self._select_input)
+        self.input_button.grid(row=row, column=2, **padding)
 
         row += 1
         ttk.Label(frame, text="出力ファイル").grid(row=row, column=0, sticky="w", **padding)
@@ -127,8 +295,12 @@ class Mp3LengthToolApp(tk.Tk):
     def _build_trim_section(self, frame: ttk.Frame, row: int) -> int:
         trim_frame = ttk.LabelFrame(frame, text="トリミング", padding=10)
         trim_frame.grid(row=row, column=0, columnspan=3, sticky="ew", padx=10, pady=(0, 10))
-        for column in range(6):
-            trim_frame.columnconfigure(column, weight=1 if column % 2 else 0)
+        trim_frame.columnconfigure(0, weight=0)
+        trim_frame.columnconfigure(1, weight=1)
+        trim_frame.columnconfigure(2, weight=0)
+        trim_frame.columnconfigure(3, weight=1)
+        trim_frame.columnconfigure(4, weight=0)
+        trim_frame.columnconfigure(5, weight=1)
 
         self.duration_label = ttk.Label(trim_frame, text="全体長: 未取得")
         self.duration_label.grid(row=0, column=0, columnspan=6, sticky="w")
@@ -147,6 +319,13 @@ class Mp3LengthToolApp(tk.Tk):
         self.timeline_canvas.bind("<B1-Motion>", self._on_timeline_drag)
         self.timeline_canvas.bind("<ButtonRelease-1>", self._on_timeline_release)
         self.timeline_canvas.bind("<ButtonPress-3>", self._on_timeline_set_playback)
+        self.timeline_canvas.bind("<Configure>", self._on_timeline_configure)
+        self.timeline_canvas.bind("<MouseWheel>", self._on_timeline_wheel)
+        self.timeline_canvas.bind("<Control-MouseWheel>", self._on_timeline_wheel)
+        self.timeline_canvas.bind("<Button-4>", self._on_timeline_wheel)
+        self.timeline_canvas.bind("<Button-5>", self._on_timeline_wheel)
+        self.timeline_canvas.bind("<Control-Button-4>", self._on_timeline_wheel)
+        self.timeline_canvas.bind("<Control-Button-5>", self._on_timeline_wheel)
         self._init_timeline_graphics()
 
         ttk.Label(trim_frame, text="開始").grid(row=2, column=0, sticky="w")
@@ -181,6 +360,7 @@ class Mp3LengthToolApp(tk.Tk):
         playback_entry.grid(row=0, column=1, sticky="w", padx=(5, 10))
         playback_entry.bind("<FocusOut>", self._on_playback_start_change)
         playback_entry.bind("<Return>", self._on_playback_start_change)
+        playback_entry.bind("<KeyRelease>", self._on_playback_start_typing)
 
         ttk.Button(playback_frame, text="選択開始を適用", command=self._set_playback_from_selection).grid(
             row=0, column=2, sticky="w", padx=(0, 10)
@@ -300,20 +480,20 @@ class Mp3LengthToolApp(tk.Tk):
             return False
         return True
 
-    def _resolve_segments(self) -> Optional[List[SegmentSpec]]:
+    def _resolve_segments(self) -> Optional[tuple[SegmentSpec, ...]]:
         if not self._ensure_total_duration():
             return None
         if self.segments:
-            return list(self.segments)
+            return tuple(self.segments)
         if self.trim_end_explicit or self.trim_start_seconds > TOLERANCE:
             end = self.trim_end_seconds
             if end - self.trim_start_seconds <= TOLERANCE:
                 messagebox.showerror("エラー", "出力する範囲を指定してください。")
                 return None
-            return [SegmentSpec(start=self.trim_start_seconds, end=end)]
-        return [SegmentSpec(start=0.0, end=self.total_duration or 0.0)]
+            return (SegmentSpec(start=self.trim_start_seconds, end=end),)
+        return (SegmentSpec(start=0.0, end=self.total_duration or 0.0),)
 
-    def _will_trim(self, segments: List[SegmentSpec]) -> bool:
+    def _will_trim(self, segments: Sequence[SegmentSpec]) -> bool:
         if self.total_duration is None:
             return False
         return not (
@@ -353,7 +533,7 @@ class Mp3LengthToolApp(tk.Tk):
             input_path=input_path,
             output_path=output_path,
             target_duration=target_duration,
-            segments=tuple(segments),
+            segments=segments,
             overwrite=self.overwrite_var.get(),
             dry_run=self.dry_run_var.get(),
         )
@@ -368,20 +548,27 @@ class Mp3LengthToolApp(tk.Tk):
         )
         self.processing_thread.start()
     def _resolve_background(self, style_name: str, fallback: str) -> str:
-        style = ttk.Style()
-        color = style.lookup(style_name, "background")
-        if not color:
-            color = style.lookup(style_name, "fieldbackground")
+        key = (id(self.tk), style_name)
+        color = self._bg_cache.get(key)
+        if color is None:
+            style = ttk.Style(self)
+            color = style.lookup(style_name, "background")
+            if not color:
+                color = style.lookup(style_name, "fieldbackground")
+            self._bg_cache[key] = color
         return color or fallback
 
     def _init_timeline_graphics(self) -> None:
         canvas = self.timeline_canvas
         canvas.delete("all")
+        self._pending_coords.clear()
+        self._pending_cfg.clear()
         center = self.timeline_height / 2
         top = center - 8
         bottom = center + 8
         left = self.timeline_padding
         right = self.timeline_width - self.timeline_padding
+        self._recompute_timeline_scale()
 
         self.timeline_track_id = canvas.create_rectangle(
             left,
@@ -430,6 +617,8 @@ class Mp3LengthToolApp(tk.Tk):
             fill="#333333",
             font=("Segoe UI", 9),
         )
+        self._last_start_ms = -1
+        self._last_end_ms = -1
 
         marker_top = center - 14
         marker_bottom = center + 14
@@ -440,6 +629,7 @@ class Mp3LengthToolApp(tk.Tk):
             marker_bottom,
             fill="#d04f4f",
             width=2,
+            tags=PLAYBACK_MARKER_TAG,
         )
         self.playback_marker_text_id = canvas.create_text(
             left,
@@ -447,65 +637,143 @@ class Mp3LengthToolApp(tk.Tk):
             text="▶",
             fill="#d04f4f",
             font=("Segoe UI", 9, "bold"),
+            tags=PLAYBACK_MARKER_TAG,
         )
         self.segment_marker_ids = []
+        self._visible_marker_count = 0
+        self._segment_image = None
+        self._segment_image_id = None
+        self._last_marker_x = None
 
     def _draw_segment_markers(self) -> None:
+        # ``segment_marker_ids`` is a pool: rectangles are moved and shown or
+        # hidden instead of being deleted and recreated on every redraw.
         canvas = self.timeline_canvas
-        for marker in self.segment_marker_ids:
-            canvas.delete(marker)
-        self.segment_marker_ids = []
+        pool = self.segment_marker_ids
+        visible = self._visible_marker_count
 
+        count = len(self.segments)
         if self.total_duration is None or self.total_duration <= 0:
-            return
+            count = 0
 
-        markers: List[int] = []
         track_top = self.timeline_height / 2 - 11
         track_bottom = self.timeline_height / 2 + 11
-        for segment in self.segments:
-            start_x = self._time_to_canvas_x(segment.start)
-            end_x = self._time_to_canvas_x(segment.end)
-            marker = canvas.create_rectangle(
-                start_x,
-                track_top,
-                end_x,
-                track_bottom,
-                fill="#cfe2ff",
-                outline="",
+        if count > SEGMENT_IMAGE_THRESHOLD:
+            self._draw_segment_image(track_top, track_bottom)
+            count = 0
+        elif self._segment_image_id is not None:
+            self._queue_config(self._segment_image_id, state="hidden")
+
+        # Only bands that intersect the zoomed view get a rectangle, clipped to the track.
+        # Bound methods are looked up once; the loop runs per segment on every redraw.
+        to_x = self._time_to_canvas_x
+        queue_coords = self._queue_coords
+        queue_config = self._queue_config
+        segments = self.segments
+        shown = 0
+        left = self.timeline_padding
+        right = self.timeline_width - self.timeline_padding
+        for index in range(count):
+            segment = segments[index]
+            start_x = to_x(segment.start)
+            end_x = to_x(segment.end)
+            if end_x < left or start_x > right:
+                continue
+            start_x = max(start_x, left)
+            end_x = min(end_x, right)
+            if shown < len(pool):
+                marker = pool[shown]
+                queue_coords(marker, start_x, track_top, end_x, track_bottom)
+                if shown >= visible:
+                    queue_config(marker, state="normal")
+            else:
+                marker = canvas.create_rectangle(
+                    start_x,
+                    track_top,
+                    end_x,
+                    track_bottom,
+                    fill=SEGMENT_MARKER_COLOR,
+                    outline="",
+                )
+                canvas.tag_lower(marker, self.timeline_selection_id)
+                pool.append(marker)
+            shown += 1
+        for marker in pool[shown:visible]:
+            queue_config(marker, state="hidden")
+        self._visible_marker_count = shown
+
+    def _draw_segment_image(self, track_top: float, track_bottom: float) -> None:
+        """Paint every segment band into a single PhotoImage shown as one canvas item."""
+        canvas = self.timeline_canvas
+        height = int(track_bottom - track_top)
+        image = self._segment_image
+        if image is None or image.width() != self.timeline_width:
+            image = tk.PhotoImage(master=self, width=self.timeline_width, height=height)
+            self._segment_image = image
+            if self._segment_image_id is None:
+                self._segment_image_id = canvas.create_image(0, track_top, anchor="nw", image=image)
+                canvas.tag_lower(self._segment_image_id, self.timeline_selection_id)
+            else:
+                self._queue_config(self._segment_image_id, image=image)
+        else:
+            image.blank()
+
+        # Merge overlapping and touching bands so each run is a single put;
+        # bands outside the zoomed view are dropped and the rest clipped to the track.
+        to_x = self._time_to_canvas_x
+        left = self.timeline_padding
+        right = self.timeline_width - self.timeline_padding + 1
+        spans = sorted(
+            (max(start_x, left), min(end_x, right))
+            for start_x, end_x in (
+                (int(to_x(segment.start)), int(to_x(segment.end)) + 1)
+                for segment in self.segments
             )
-            canvas.tag_lower(marker, self.timeline_selection_id)
-            markers.append(marker)
-        self.segment_marker_ids = markers
+            if end_x > left and start_x < right
+        )
+        if not spans:
+            self._queue_config(self._segment_image_id, state="hidden")
+            return
+        run_start, run_end = spans[0]
+        for start_x, end_x in spans[1:]:
+            if start_x <= run_end:
+                run_end = max(run_end, end_x)
+                continue
+            image.put(SEGMENT_MARKER_COLOR, to=(run_start, 0, run_end, height))
+            run_start, run_end = start_x, end_x
+        image.put(SEGMENT_MARKER_COLOR, to=(run_start, 0, run_end, height))
+        self._queue_config(self._segment_image_id, state="normal")
 
     def _update_timeline_canvas(self) -> None:
-        canvas = self.timeline_canvas
         center = self.timeline_height / 2
         top = center - 8
         bottom = center + 8
         left = self.timeline_padding
         handle_half = self.timeline_handle_half
+        queue_coords = self._queue_coords
+        queue_config = self._queue_config
 
         if self.total_duration is None or self.total_duration <= 0:
-            canvas.coords(self.timeline_selection_id, left, top, left, bottom)
-            canvas.coords(
+            queue_coords(self.timeline_selection_id, left, top, left, bottom)
+            queue_coords(
                 self.timeline_start_handle_id,
                 left - handle_half,
                 top - 5,
                 left + handle_half,
                 bottom + 5,
             )
-            canvas.coords(
+            queue_coords(
                 self.timeline_end_handle_id,
                 left - handle_half,
                 top - 5,
                 left + handle_half,
                 bottom + 5,
             )
-            canvas.itemconfig(self.timeline_start_text_id, text="未取得")
-            canvas.coords(self.timeline_start_text_id, left, bottom + 16)
-            canvas.itemconfig(self.timeline_end_text_id, text="")
-            self._draw_segment_markers()
-            self._update_playback_marker()
+            queue_config(self.timeline_start_text_id, text="未取得")
+            queue_coords(self.timeline_start_text_id, left, bottom + 16)
+            queue_config(self.timeline_end_text_id, text="")
+            self._last_start_ms = -1
+            self._last_end_ms = -1
             return
 
         start_x = self._time_to_canvas_x(self.trim_start_seconds)
@@ -513,28 +781,88 @@ class Mp3LengthToolApp(tk.Tk):
         if end_x - start_x < 2:
             end_x = start_x + 2
 
-        canvas.coords(self.timeline_selection_id, start_x, top, end_x, bottom)
-        canvas.coords(
+        # When zoomed the bar is clipped to the track; the handles may leave the view.
+        queue_coords(
+            self.timeline_selection_id,
+            self._clamp_canvas_x(start_x),
+            top,
+            self._clamp_canvas_x(end_x),
+            bottom,
+        )
+        queue_coords(
             self.timeline_start_handle_id,
             start_x - handle_half,
             top - 5,
             start_x + handle_half,
             bottom + 5,
         )
-        canvas.coords(
+        queue_coords(
             self.timeline_end_handle_id,
             end_x - handle_half,
             top - 5,
             end_x + handle_half,
             bottom + 5,
         )
-        canvas.itemconfig(self.timeline_start_text_id, text=format_duration(self.trim_start_seconds))
-        canvas.coords(self.timeline_start_text_id, start_x, bottom + 16)
-        canvas.itemconfig(self.timeline_end_text_id, text=format_duration(self.trim_end_seconds))
-        canvas.coords(self.timeline_end_text_id, end_x, bottom + 16)
+        # Labels show millisecond precision; while dragging most frames leave them unchanged.
+        start_ms = int(round(self.trim_start_seconds * 1000))
+        if start_ms != self._last_start_ms:
+            self._last_start_ms = start_ms
+            queue_config(self.timeline_start_text_id, text=_format_time(self.trim_start_seconds))
+        queue_coords(self.timeline_start_text_id, start_x, bottom + 16)
+        end_ms = int(round(self.trim_end_seconds * 1000))
+        if end_ms != self._last_end_ms:
+            self._last_end_ms = end_ms
+            queue_config(self.timeline_end_text_id, text=_format_time(self.trim_end_seconds))
+        queue_coords(self.timeline_end_text_id, end_x, bottom + 16)
+
+    def _request_canvas_update(self, parts: int) -> None:
+        """Mark timeline regions dirty and redraw them once on the next idle tick."""
+        self._dirty_mask |= parts
+        if self._canvas_visible and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_canvas_updates)
+
+    def _flush_canvas_updates(self) -> None:
+        self._flush_scheduled = False
+        if not self._canvas_visible or not self.timeline_canvas.winfo_viewable():
+            return  # keep the mask; _on_map flushes it once the canvas is shown
+        mask = self._dirty_mask
+        self._dirty_mask = 0
+        if mask & DIRTY_SELECTION:
+            self._update_timeline_canvas()
+        if mask & DIRTY_SEGMENTS:
+            self._draw_segment_markers()
+        if mask & DIRTY_MARKER:
+            self._update_playback_marker()
+
+        canvas_coords = self.timeline_canvas.coords
+        for item, coords in self._pending_coords.items():
+            canvas_coords(item, *coords)
+        self._pending_coords.clear()
+        itemconfig = self.timeline_canvas.itemconfig
+        for item, options in self._pending_cfg.items():
+            itemconfig(item, **options)
+        self._pending_cfg.clear()
+
+    def _queue_coords(self, item: int, *coords: float) -> None:
+        self._pending_coords[item] = coords
+
+    def _queue_config(self, item: int, **options: object) -> None:
+        self._pending_cfg.setdefault(item, {}).update(options)
+
+    def _on_map(self, event: tk.Event) -> None:
+        if event.widget is self:
+            self._canvas_visible = True
+        elif event.widget is not self.timeline_canvas:
+            return
+        if self._dirty_mask and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_canvas_updates)
+
+    def _on_unmap(self, event: tk.Event) -> None:
+        if event.widget is self:
+            self._canvas_visible = False
 
-        self._draw_segment_markers()
-        self._update_playback_marker()
     def _set_trim_range(
         self,
         start: float,
@@ -557,58 +885,212 @@ class Mp3LengthToolApp(tk.Tk):
         if self.total_duration is not None:
             start = min(start, self.total_duration)
             end = min(max(end, start), self.total_duration)
+
+        applied = self._applied_trim
+        if (
+            applied is not None
+            and end_explicit == applied[2]
+            and self.total_duration == applied[3]
+            and abs(start - applied[0]) < 1e-6
+            and abs(end - applied[1]) < 1e-6
+        ):
+            # Nothing moved; only restore entry text the user left out of sync.
+            if update_entries and self._entries_out_of_sync():
+                self._update_trim_entries()
+            return
+        self._applied_trim = (start, end, end_explicit, self.total_duration)
+
         self.trim_start_seconds = start
         self.trim_end_seconds = end
         self.trim_end_explicit = end_explicit
         if update_entries:
             self._update_trim_entries()
         if update_canvas:
-            self._update_timeline_canvas()
+            self._request_canvas_update(DIRTY_SELECTION)
         self._update_duration_summary()
 
     def _update_trim_entries(self) -> None:
-        self.trim_start_var.set(format_duration(self.trim_start_seconds))
+        start_text = _format_time(self.trim_start_seconds)
         if self.trim_end_explicit or self.total_duration is None:
-            self.trim_end_var.set(format_duration(self.trim_end_seconds))
+            end_text = _format_time(self.trim_end_seconds)
         else:
-            self.trim_end_var.set("")
+            end_text = ""
         length_seconds = max(self.trim_end_seconds - self.trim_start_seconds, 0.0)
-        self.trim_length_var.set(format_duration(length_seconds))
+        length_text = _format_time(length_seconds)
+        self._set_if_changed(self.trim_start_var, start_text)
+        self._set_if_changed(self.trim_end_var, end_text)
+        self._set_if_changed(self.trim_length_var, length_text)
+        synced = self._entry_synced_text
+        synced["start"] = start_text
+        synced["end"] = end_text
+        synced["length"] = length_text
+
+    @staticmethod
+    def _set_if_changed(var: tk.StringVar, text: str) -> None:
+        # Setting a StringVar fires its traces even when the text is the same.
+        if var.get() != text:
+            var.set(text)
+
+    def _entries_out_of_sync(self) -> bool:
+        synced = self._entry_synced_text
+        return (
+            self.trim_start_var.get() != synced.get("start")
+            or self.trim_end_var.get() != synced.get("end")
+            or self.trim_length_var.get() != synced.get("length")
+        )
+
+    def _debounce(self, key: str, fn: Callable[[], object], delay: int = ENTRY_DEBOUNCE_MS) -> None:
+        """Run ``fn`` after ``delay`` ms, replacing any call still pending under ``key``."""
+        pending = self._debounce_pending.pop(key, None)
+        if pending is not None:
+            self.after_cancel(pending[0])
+        after_id = self.after(delay, self._run_debounced, key)
+        self._debounce_pending[key] = (after_id, fn)
+
+    def _run_debounced(self, key: str) -> None:
+        pending = self._debounce_pending.pop(key, None)
+        if pending is not None:
+            pending[1]()
+
+    def _flush_debounced(self) -> None:
+        """Apply pending entry edits now, before an action that reads the trim state."""
+        for key in list(self._debounce_pending):
+            # A flushed callback may open a modal dialog whose event loop runs
+            # (and pops) another pending timer before we reach its key.
+            pending = self._debounce_pending.pop(key, None)
+            if pending is None:
+                continue
+            after_id, fn = pending
+            self.after_cancel(after_id)
+            fn()
+
+    def _entry_unchanged(self, key: str, text: str) -> bool:
+        return self._entry_synced_text.get(key) == text
+
+    def _recompute_timeline_scale(self) -> None:
+        """Refresh the cached scale; call whenever total_duration, timeline_width or the zoom changes."""
+        self._last_marker_x = None
+        if self.total_duration != self._scale_total:
+            self._scale_total = self.total_duration
+            self._zoom = 1.0
+            self._scroll_t0 = 0.0
+        self._usable_px = self.timeline_width - (self.timeline_padding * 2)
+        if self._usable_px > 0 and self.total_duration and self.total_duration > 0:
+            self._px_per_sec = self._usable_px * self._zoom / self.total_duration
+            self._sec_per_px = 1.0 / self._px_per_sec
+            span = self.total_duration / self._zoom
+            self._scroll_t0 = min(max(self._scroll_t0, 0.0), self.total_duration - span)
+        else:
+            self._px_per_sec = 0.0
+            self._sec_per_px = 0.0
+            self._scroll_t0 = 0.0
+
+    def _on_timeline_configure(self, event: tk.Event) -> None:
+        # The grid may stretch the canvas past its requested width; follow it.
+        if event.width <= 1 or event.width == self.timeline_width:
+            return
+        self.timeline_width = event.width
+        self._recompute_timeline_scale()
+        center = self.timeline_height / 2
+        self._queue_coords(
+            self.timeline_track_id,
+            self.timeline_padding,
+            center - 8,
+            self.timeline_width - self.timeline_padding,
+            center + 8,
+        )
+        self._request_canvas_update(DIRTY_ALL)
+
+    def _on_timeline_wheel(self, event: tk.Event) -> None:
+        if not self._px_per_sec:
+            return
+        if event.num == 4:
+            notches = 1
+        elif event.num == 5:
+            notches = -1
+        else:
+            notches = 1 if event.delta > 0 else -1 if event.delta < 0 else 0
+        if not notches:
+            return
+
+        if event.state & 0x0004:
+            zoom = min(max(self._zoom * ZOOM_STEP**notches, 1.0), MAX_ZOOM)
+            if zoom == self._zoom:
+                return
+            # Keep the time under the pointer where it is.
+            x = self._clamp_canvas_x(event.x)
+            anchor = self._canvas_x_to_time(x)
+            self._zoom = zoom
+            self._scroll_t0 = anchor - (x - self.timeline_padding) * self.total_duration / (self._usable_px * zoom)
+            self._set_status(f"ズーム {zoom:.2f}x")
+        else:
+            if self._zoom == 1.0:
+                return
+            self._scroll_t0 -= notches * PAN_FRACTION * self.total_duration / self._zoom
+        self._recompute_timeline_scale()
+        self._request_canvas_update(DIRTY_ALL)
 
     def _time_to_canvas_x(self, seconds: float) -> float:
-        usable = self.timeline_width - (self.timeline_padding * 2)
-        ratio = 0.0
-        if self.total_duration and self.total_duration > 0:
-            ratio = min(max(seconds / self.total_duration, 0.0), 1.0)
-        return self.timeline_padding + (ratio * usable)
+        if not self._px_per_sec:
+            return self.timeline_padding
+        seconds = min(max(seconds, 0.0), self.total_duration)
+        return self.timeline_padding + (seconds - self._scroll_t0) * self._px_per_sec
 
     def _canvas_x_to_time(self, x: float) -> float:
-        clamped = self._clamp_canvas_x(x)
-        usable = self.timeline_width - (self.timeline_padding * 2)
-        if usable <= 0 or not self.total_duration:
-            return 0.0
-        return ((clamped - self.timeline_padding) / usable) * self.total_duration
+        return self._scroll_t0 + (self._clamp_canvas_x(x) - self.timeline_padding) * self._sec_per_px
 
     def _clamp_canvas_x(self, x: float) -> float:
         return min(max(x, self.timeline_padding), self.timeline_width - self.timeline_padding)
 
+    @staticmethod
+    def _segment_label(index: int, segment: SegmentSpec) -> str:
+        duration = max(segment.end - segment.start, 0.0)
+        return (
+            f"{index:>2}: {_format_time(segment.start)}"
+            f" -> {_format_time(segment.end)}"
+            f" ({duration:.3f} 秒)"
+        )
+
     def _update_segment_list(self) -> None:
-        self.segment_listbox.delete(0, tk.END)
-        total = 0.0
-        for index, segment in enumerate(self.segments, 1):
-            duration = max(segment.end - segment.start, 0.0)
-            total += duration
-            label = (
-                f"{index:>2}: {format_duration(segment.start)}"
-                f" -> {format_duration(segment.end)}"
-                f" ({duration:.3f} 秒)"
-            )
-            self.segment_listbox.insert(tk.END, label)
-        self.segment_info_var.set(f"セグメント {len(self.segments)} 件 / 合計 {total:.3f} 秒")
-        self._draw_segment_markers()
+        """Re-render every row and recompute the total (used after bulk changes)."""
+        self._segments_total = sum(max(segment.end - segment.start, 0.0) for segment in self.segments)
+        self._render_segment_rows(0)
+
+    def _render_segment_rows(self, first: int, last: Optional[int] = None) -> None:
+        """Sync listbox rows ``first..last`` (default: to the end) with ``self.segments``."""
+        listbox = self.segment_listbox
+        rows = self._segment_rows
+        count = len(self.segments)
+        if last is None:
+            last = count - 1
+            if len(rows) > count:
+                listbox.delete(count, tk.END)
+                del rows[count:]
+        for index in range(first, last + 1):
+            label = self._segment_label(index + 1, self.segments[index])
+            if index < len(rows):
+                if rows[index] == label:
+                    continue
+                listbox.delete(index)
+                listbox.insert(index, label)
+                rows[index] = label
+            else:
+                listbox.insert(tk.END, label)
+                rows.append(label)
+        self._segments_changed()
+
+    def _segments_changed(self) -> None:
+        self._segments_version += 1
+        if not self.segments:
+            self._segments_total = 0.0
+        self.segment_info_var.set(
+            f"セグメント {len(self.segments)} 件 / 合計 {self._segments_total:.3f} 秒"
+        )
+        self._request_canvas_update(DIRTY_SEGMENTS)
         self._update_duration_summary()
 
     def _add_segment(self) -> None:
+        self._flush_debounced()
         if self.total_duration is None:
             messagebox.showerror("エラー", "入力ファイルの長さを取得してから追加してください。")
             return
@@ -617,7 +1099,8 @@ class Mp3LengthToolApp(tk.Tk):
             return
         new_segment = SegmentSpec(start=self.trim_start_seconds, end=self.trim_end_seconds)
         self.segments.append(new_segment)
-        self._update_segment_list()
+        self._segments_total += max(new_segment.end - new_segment.start, 0.0)
+        self._render_segment_rows(len(self.segments) - 1)
         self._set_status("セグメントを追加しました")
 
     def _remove_segment(self) -> None:
@@ -625,8 +1108,10 @@ class Mp3LengthToolApp(tk.Tk):
         if not selection:
             return
         index = selection[0]
-        self.segments.pop(index)
-        self._update_segment_list()
+        removed = self.segments.pop(index)
+        self._segments_total -= max(removed.end - removed.start, 0.0)
+        # Rows after ``index`` shift up and are renumbered.
+        self._render_segment_rows(index)
         self._set_status("セグメントを削除しました")
 
     def _move_segment(self, offset: int) -> None:
@@ -641,7 +1126,7 @@ class Mp3LengthToolApp(tk.Tk):
             self.segments[new_index],
             self.segments[index],
         )
-        self._update_segment_list()
+        self._render_segment_rows(min(index, new_index), max(index, new_index))
         self.segment_listbox.selection_set(new_index)
         self.segment_listbox.activate(new_index)
         self._set_status("セグメントの順番を変更しました")
@@ -652,7 +1137,9 @@ class Mp3LengthToolApp(tk.Tk):
         if not messagebox.askyesno("確認", "セグメントをすべて削除しますか?"):
             return
         self.segments.clear()
-        self._update_segment_list()
+        self.segment_listbox.delete(0, tk.END)
+        self._segment_rows.clear()
+        self._segments_changed()
         self._set_status("セグメントをクリアしました")
 
     def _load_selected_segment(self, event: Optional[tk.Event] = None) -> None:
@@ -675,9 +1162,7 @@ class Mp3LengthToolApp(tk.Tk):
         if not self.output_var.get().strip():
             path = Path(file_path)
             self.output_var.set(str(path.with_name(f"{path.stem}_edited.mp3")))
-        self._set_status("長さを取得中...")
-        self.update_idletasks()
-        self._load_input_duration(Path(file_path))
+        self._load_input_duration_async(Path(file_path))
         self.segments.clear()
         self._update_segment_list()
         self._set_playback_start(0.0)
@@ -691,37 +1176,93 @@ class Mp3LengthToolApp(tk.Tk):
         if file_path:
             self.output_var.set(file_path)
 
-    def _load_input_duration(self, path: Path) -> None:
+    def _load_input_duration_async(self, path: Path) -> None:
+        # Every outcome changes total_duration, and with it the timeline scale.
+        self._request_canvas_update(DIRTY_ALL)
+        self.total_duration = None
+        self._recompute_timeline_scale()
+        self.duration_label.config(text="全体長: 取得中...")
+        self._set_trim_range(0.0, None, end_explicit=False)
+        self._set_status("長さを取得中...")
+
+        try:
+            st = path.stat()
+        except OSError:
+            key = None  # let ffprobe report the problem
+        else:
+            key = (str(path), st.st_mtime_ns, st.st_size)
+            cached = self._duration_cache.get(key)
+            if cached is not None:
+                self._apply_probe_result(path, cached, key)
+                return
+
+        self.input_button.config(state=tk.DISABLED)
+        threading.Thread(
+            target=self._probe_worker,
+            args=(path, key),
+            daemon=True,
+        ).start()
+
+    def _probe_worker(self, path: Path, key: Optional[DurationKey]) -> None:
+        result: object
         try:
             ffprobe_path = resolve_executable("ffprobe")
-        except FileNotFoundError:
+        except FileNotFoundError as exc:
+            result = exc
+        else:
+            try:
+                result = probe_duration(path, ffprobe_path)
+            except Exception as exc:  # noqa: BLE001 - surface error to the UI
+                result = exc
+        self.after(0, lambda res=result: self._apply_probe_result(path, res, key))
+
+    def _apply_probe_result(self, path: Path, result: object, key: Optional[DurationKey] = None) -> None:
+        self.input_button.config(state=tk.NORMAL)
+        self._request_canvas_update(DIRTY_ALL)
+        if isinstance(result, Exception) and key is not None:
+            self._duration_cache.pop(key, None)
+        if isinstance(result, FileNotFoundError):
             self.total_duration = None
+            self._recompute_timeline_scale()
             self.duration_label.config(text="全体長: 取得できません (ffprobe未検出)")
             self._set_trim_range(0.0, None, end_explicit=False)
             self._set_status("ffprobeが見つからないため長さを取得できません")
             return
-
-        try:
-            duration = probe_duration(path, ffprobe_path)
-        except RuntimeError as exc:
+        if isinstance(result, Exception):
             self.total_duration = None
+            self._recompute_timeline_scale()
             self.duration_label.config(text="全体長: 取得できません")
-            messagebox.showerror("エラー", str(exc))
+            messagebox.showerror("エラー", str(result))
             self._set_trim_range(0.0, None, end_explicit=False)
             self._set_status("長さの取得に失敗しました")
             return
 
-        self.total_duration = max(duration, 0.0)
+        self.total_duration = max(float(result), 0.0)
+        self._recompute_timeline_scale()
+        if key is not None and key not in self._duration_cache:
+            cache = self._duration_cache
+            if len(cache) >= DURATION_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = self.total_duration
         self.duration_label.config(
-            text=f"全体長: {format_duration(self.total_duration)} ({self.total_duration:.3f} 秒)"
+            text=f"全体長: {_format_time(self.total_duration)} ({self.total_duration:.3f} 秒)"
         )
         self._set_trim_range(0.0, None, end_explicit=False)
         self._set_playback_start(0.0)
         self._set_status("長さを取得しました")
     def _on_start_entry_change(self, event: Optional[tk.Event] = None) -> None:
+        if event is not None:
+            self._debounce("start", self._apply_start_entry)
+        else:
+            self._apply_start_entry()
+
+    def _apply_start_entry(self) -> None:
+        text = self.trim_start_var.get()
+        if self._entry_unchanged("start", text):
+            return
         try:
             value = _parse_optional(
-                self.trim_start_var.get(),
+                text,
                 allow_zero=True,
                 default=self.trim_start_seconds,
             )
@@ -733,12 +1274,20 @@ class Mp3LengthToolApp(tk.Tk):
         self._set_trim_range(start_value, self.trim_end_seconds, end_explicit=self.trim_end_explicit)
 
     def _on_end_entry_change(self, event: Optional[tk.Event] = None) -> None:
+        if event is not None:
+            self._debounce("end", self._apply_end_entry)
+        else:
+            self._apply_end_entry()
+
+    def _apply_end_entry(self) -> None:
         text = self.trim_end_var.get()
+        if self._entry_unchanged("end", text):
+            return
         if not text.strip():
             self._set_trim_range(self.trim_start_seconds, None, end_explicit=False)
             return
         try:
-            value = parse_duration(text, allow_zero=True)
+            value = _parse_duration_cached(text, allow_zero=True)
         except ValueError as exc:
             messagebox.showerror("エラー", f"終了位置の入力が不正です: {exc}")
             self._update_trim_entries()
@@ -746,12 +1295,20 @@ class Mp3LengthToolApp(tk.Tk):
         self._set_trim_range(self.trim_start_seconds, value, end_explicit=True)
 
     def _on_trim_length_entry(self, event: Optional[tk.Event] = None) -> None:
+        if event is not None:
+            self._debounce("length", self._apply_trim_length_entry)
+        else:
+            self._apply_trim_length_entry()
+
+    def _apply_trim_length_entry(self) -> None:
         text = self.trim_length_var.get()
+        if self._entry_unchanged("length", text):
+            return
         if not text.strip():
             self._update_trim_entries()
             return
         try:
-            length = parse_duration(text, allow_zero=False)
+            length = _parse_duration_cached(text, allow_zero=False)
         except ValueError as exc:
             messagebox.showerror("エラー", f"長さの入力が不正です: {exc}")
             self._update_trim_entries()
@@ -767,7 +1324,7 @@ class Mp3LengthToolApp(tk.Tk):
         if event.state & 0x0004:
             seconds = self._canvas_x_to_time(self._clamp_canvas_x(event.x))
             self._set_playback_start(seconds)
-            self._set_status(f"再生開始を {format_duration(seconds)} に設定しました")
+            self._set_status(f"再生開始を {_format_time(seconds)} に設定しました")
             return
         x = self._clamp_canvas_x(event.x)
         start_x = self._time_to_canvas_x(self.trim_start_seconds)
@@ -786,14 +1343,26 @@ class Mp3LengthToolApp(tk.Tk):
             return
         if self.total_duration is None or self.total_duration <= 0:
             return
-        x = self._clamp_canvas_x(event.x)
-        seconds = self._canvas_x_to_time(x)
+        # _canvas_x_to_time clamps to the track itself.
+        self._pending_drag_seconds = self._canvas_x_to_time(event.x)
+        if self._drag_after_id is None:
+            self._drag_after_id = self.after(DRAG_FLUSH_MS, self._flush_drag)
+
+    def _flush_drag(self) -> None:
+        self._drag_after_id = None
+        seconds = self._pending_drag_seconds
+        self._pending_drag_seconds = None
+        if seconds is None or self._active_handle is None:
+            return
         if self._active_handle == "start":
             self._set_trim_range(seconds, self.trim_end_seconds, end_explicit=self.trim_end_explicit)
         else:
             self._set_trim_range(self.trim_start_seconds, seconds, end_explicit=True)
 
     def _on_timeline_release(self, event: tk.Event) -> None:
+        if self._drag_after_id is not None:
+            self.after_cancel(self._drag_after_id)
+            self._flush_drag()
         self._active_handle = None
 
     def _on_timeline_set_playback(self, event: tk.Event) -> None:
@@ -801,7 +1370,7 @@ class Mp3LengthToolApp(tk.Tk):
             return
         seconds = self._canvas_x_to_time(self._clamp_canvas_x(event.x))
         self._set_playback_start(seconds)
-        self._set_status(f"再生開始を {format_duration(seconds)} に設定しました")
+        self._set_status(f"再生開始を {_format_time(seconds)} に設定しました")
     def _set_playback_start(
         self,
         seconds: float,
@@ -815,9 +1384,11 @@ class Mp3LengthToolApp(tk.Tk):
             seconds = max(0.0, seconds)
         self.playback_start_seconds = seconds
         if update_entry:
-            self.playback_start_var.set(format_duration(seconds))
+            text = _format_time(seconds)
+            self._set_if_changed(self.playback_start_var, text)
+            self._entry_synced_text["playback"] = text
         if update_marker:
-            self._update_playback_marker()
+            self._request_canvas_update(DIRTY_MARKER)
 
     def _update_playback_marker(self) -> None:
         if self.playback_marker_id is None or self.playback_marker_text_id is None:
@@ -826,17 +1397,40 @@ class Mp3LengthToolApp(tk.Tk):
             x = self.timeline_padding
         else:
             x = self._time_to_canvas_x(self.playback_start_seconds)
+        # Whole pixels only, so sub-pixel changes do not cost a redraw.
+        x = int(round(x))
+        last_x = self._last_marker_x
+        if x == last_x:
+            return
+        self._last_marker_x = x
+        if last_x is not None:
+            self.timeline_canvas.move(PLAYBACK_MARKER_TAG, x - last_x, 0)
+            return
+        # First placement, or the scale changed: position both items absolutely.
         marker_top = self.timeline_height / 2 - 14
         marker_bottom = self.timeline_height / 2 + 14
-        self.timeline_canvas.coords(self.playback_marker_id, x, marker_top, x, marker_bottom)
-        self.timeline_canvas.coords(self.playback_marker_text_id, x, marker_top - 4)
+        self._queue_coords(self.playback_marker_id, x, marker_top, x, marker_bottom)
+        self._queue_coords(self.playback_marker_text_id, x, marker_top - 4)
 
     def _update_duration_summary(self) -> None:
-        if self.total_duration is None:
-            self.summary_var.set("出力 0.000 秒 / 残り --.- 秒")
+        # With segments the trim range does not affect the totals, so drags skip the walk.
+        if self.segments:
+            key = (self.total_duration, self._segments_version)
+        else:
+            key = (self.total_duration, self.trim_start_seconds, self.trim_end_seconds, self.trim_end_explicit)
+        if key == self._last_summary_key:
             return
+        self._last_summary_key = key
+
+        if self.total_duration is None:
+            text = "出力 0.000 秒 / 残り --.- 秒"
+        else:
+            text = self._summary_text()
+        self._set_if_changed(self.summary_var, text)
+
+    def _summary_text(self) -> str:
         if self.segments:
-            kept = sum(max(segment.end - segment.start, 0.0) for segment in self.segments)
+            kept = self._segments_total
         else:
             if self.trim_end_explicit or self.trim_start_seconds > TOLERANCE:
                 kept = max(self.trim_end_seconds - self.trim_start_seconds, 0.0)
@@ -844,7 +1438,7 @@ class Mp3LengthToolApp(tk.Tk):
                 kept = self.total_duration
         kept = min(max(kept, 0.0), self.total_duration)
         remaining = max(self.total_duration - kept, 0.0)
-        self.summary_var.set(f"出力 {kept:.3f} 秒 / 残り {remaining:.3f} 秒")
+        return f"出力 {kept:.3f} 秒 / 残り {remaining:.3f} 秒"
 
     def toggle_playback(self) -> None:
         if self.play_process and self.play_process.poll() is None:
@@ -876,42 +1470,81 @@ class Mp3LengthToolApp(tk.Tk):
         self._start_playback(input_path, self.playback_start_seconds, preview_duration)
 
     def _on_playback_start_change(self, event: Optional[tk.Event] = None) -> bool:
+        if event is not None:
+            self._debounce("playback", self._apply_playback_start_entry)
+            return True
+        return self._apply_playback_start_entry()
+
+    def _on_playback_start_typing(self, event: tk.Event) -> None:
+        # A key of its own: releasing Return must not replace the apply that <Return> queued.
+        self._debounce("playback_typing", self._preview_playback_start_entry, delay=TYPING_DEBOUNCE_MS)
+
+    def _preview_playback_start_entry(self) -> None:
+        """Move the marker to a complete time while typing; partial input waits for Return/FocusOut."""
         text = self.playback_start_var.get()
+        if self._entry_unchanged("playback", text):
+            return
         try:
-            seconds = parse_duration(text, allow_zero=True)
+            seconds = _parse_duration_cached(text, allow_zero=True)
+        except ValueError:
+            return
+        self._set_playback_start(seconds, update_entry=False)
+
+    def _apply_playback_start_entry(self) -> bool:
+        pending = self._debounce_pending.pop("playback_typing", None)
+        if pending is not None:
+            self.after_cancel(pending[0])
+        text = self.playback_start_var.get()
+        if self._entry_unchanged("playback", text):
+            return True
+        try:
+            seconds = _parse_duration_cached(text, allow_zero=True)
         except ValueError as exc:
             messagebox.showerror("エラー", f"再生開始の入力が不正です: {exc}")
-            self.playback_start_var.set(format_duration(self.playback_start_seconds))
+            self._set_playback_start(self.playback_start_seconds, update_marker=False)
             return False
         self._set_playback_start(seconds, update_entry=True)
         return True
 
     def _set_playback_from_selection(self) -> None:
+        self._flush_debounced()
         self._set_playback_start(self.trim_start_seconds)
         self._set_status("再生開始位置を選択開始に合わせました")
 
     def _on_preview_length_change(self, event: Optional[tk.Event] = None) -> None:
+        if event is not None:
+            self._debounce("preview", self._apply_preview_length_entry)
+        else:
+            self._apply_preview_length_entry()
+
+    def _apply_preview_length_entry(self) -> None:
         text = self.preview_length_var.get().strip()
-        if not text:
+        if not text or self._entry_unchanged("preview", text):
             return
         try:
-            parse_duration(text, allow_zero=False)
+            _parse_duration_cached(text, allow_zero=False)
         except ValueError as exc:
             messagebox.showerror("エラー", f"プレビュー長さの入力が不正です: {exc}")
             self.preview_length_var.set("")
+            return
+        self._entry_synced_text["preview"] = text
 
     def _set_preview_from_selection(self) -> None:
+        self._flush_debounced()
         length = max(self.trim_end_seconds - self.trim_start_seconds, 0.0)
         if length <= TOLERANCE:
             messagebox.showerror("エラー", "選択範囲が設定されていません。")
             return
-        self.preview_length_var.set(f"{length:.3f}")
+        self._set_if_changed(self.preview_length_var, f"{length:.3f}")
         self._set_status("プレビュー長さを選択範囲に合わせました")
 
     def _get_preview_duration(self, start: float) -> float:
         text = self.preview_length_var.get().strip()
+        key = (text, self.trim_end_explicit, self.trim_end_seconds, self.total_duration, start)
+        if key == self._preview_duration_key:
+            return self._preview_duration_value
         if text:
-            duration = parse_duration(text, allow_zero=False)
+            duration = _parse_duration_cached(text, allow_zero=False)
         else:
             if self.trim_end_explicit and self.trim_end_seconds > start + TOLERANCE:
                 duration = self.trim_end_seconds - start
@@ -923,8 +1556,104 @@ class Mp3LengthToolApp(tk.Tk):
             duration = min(duration, max(self.total_duration - start, 0.0))
         if duration <= 0.0:
             raise ValueError("プレビュー長さが短すぎます。")
+        self._preview_duration_key = key
+        self._preview_duration_value = duration
         return duration
     def _start_playback(self, input_path: Path, start: float, duration: float) -> None:
+        process = self._play_cached_preview(input_path, start, duration)
+        if process is None:
+            process = self._spawn_ffplay(input_path, start, duration)
+            if process is None:
+                return
+
+        self.play_process = process
+        self._set_play_button_state(playing=True)
+        self._set_status(f"再生中... (開始: {_format_time(start)})")
+        self._playback_poll_id = self.after(PLAYBACK_POLL_MS, self._poll_playback)
+
+    def _play_cached_preview(self, input_path: Path, start: float, duration: float) -> Optional[_BufferPlayback]:
+        """Play the clip from memory if it was decoded before.
+
+        On a miss the caller falls back to ffplay right away while the clip is
+        decoded on a worker thread, so a replay can start from memory.
+        """
+        if simpleaudio is None or duration > PREVIEW_CACHE_MAX_SECONDS:
+            return None
+        try:
+            key = (str(input_path), input_path.stat().st_mtime_ns, round(start, 2), round(duration, 2))
+        except OSError:
+            return None
+
+        cache = self._preview_cache
+        pcm = cache.pop(key, None)
+        if pcm is None:
+            if key not in self._preview_decoding:
+                self._preview_decoding.add(key)
+                threading.Thread(
+                    target=self._preview_decode_worker,
+                    args=(key, input_path, start, duration),
+                    daemon=True,
+                ).start()
+            return None
+        cache[key] = pcm  # (re)inserted as the most recently played
+
+        self._stop_playback()
+        try:
+            play_object = simpleaudio.play_buffer(pcm, PREVIEW_CHANNELS, 2, PREVIEW_SAMPLE_RATE)
+        except Exception:  # no usable audio device; fall back to ffplay
+            return None
+        return _BufferPlayback(play_object)
+
+    def _preview_decode_worker(
+        self,
+        key: Tuple[str, int, float, float],
+        input_path: Path,
+        start: float,
+        duration: float,
+    ) -> None:
+        pcm = self._decode_preview(input_path, start, duration)
+        self.after(0, lambda: self._store_preview(key, pcm))
+
+    def _store_preview(self, key: Tuple[str, int, float, float], pcm: Optional[bytes]) -> None:
+        self._preview_decoding.discard(key)
+        if pcm is None:
+            return
+        cache = self._preview_cache
+        cache.pop(key, None)
+        if len(cache) >= PREVIEW_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = pcm
+
+    def _decode_preview(self, input_path: Path, start: float, duration: float) -> Optional[bytes]:
+        try:
+            ffmpeg_path = resolve_executable("ffmpeg")
+        except FileNotFoundError:
+            return None
+        cmd = [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-nostdin",
+        ]
+        if start > TOLERANCE:
+            cmd.extend(("-ss", "%.6f" % start))
+        cmd.extend(("-t", "%.6f" % duration, "-i", str(input_path)))
+        cmd.extend(("-vn", "-f", "s16le", "-ac", str(PREVIEW_CHANNELS), "-ar", str(PREVIEW_SAMPLE_RATE), "-"))
+        try:
+            completed = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+                close_fds=_CLOSE_FDS,
+                creationflags=_CREATION_FLAGS,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return completed.stdout or None
+
+    def _spawn_ffplay(self, input_path: Path, start: float, duration: float) -> Optional[subprocess.Popen]:
         try:
             ffplay_path = resolve_executable("ffplay")
         except FileNotFoundError:
@@ -932,7 +1661,7 @@ class Mp3LengthToolApp(tk.Tk):
                 "エラー",
                 "ffplay が見つかりません。FFmpeg の ffplay を PATH に追加してください。",
             )
-            return
+            return None
 
         self._stop_playback()
         cmd = [
@@ -944,42 +1673,40 @@ class Mp3LengthToolApp(tk.Tk):
             "error",
         ]
         if start > TOLERANCE:
-            cmd.extend(["-ss", f"{start:.6f}"])
+            cmd.extend(("-ss", "%.6f" % start))
         if duration > TOLERANCE:
-            cmd.extend(["-t", f"{duration:.6f}"])
+            cmd.extend(("-t", "%.6f" % duration))
         cmd.append(str(input_path))
 
         try:
             process = subprocess.Popen(
                 cmd,
+                bufsize=0,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                close_fds=_CLOSE_FDS,
+                creationflags=_CREATION_FLAGS,
             )
         except OSError as exc:
             messagebox.showerror("エラー", f"ffplay の起動に失敗しました: {exc}")
-            return
-
-        self.play_process = process
-        self._set_play_button_state(playing=True)
-        self._set_status(f"再生中... (開始: {format_duration(start)})")
-        self.playback_thread = threading.Thread(
-            target=self._monitor_playback,
-            args=(process,),
-            daemon=True,
-        )
-        self.playback_thread.start()
+            return None
+        return process
 
-    def _monitor_playback(self, process: subprocess.Popen) -> None:
-        try:
-            process.wait()
-        finally:
-            self.after(0, lambda proc=process: self._playback_finished(proc))
+    def _poll_playback(self) -> None:
+        self._playback_poll_id = None
+        process = self.play_process
+        if process is None:
+            return
+        if process.poll() is None:
+            self._playback_poll_id = self.after(PLAYBACK_POLL_MS, self._poll_playback)
+            return
+        self._playback_finished(process)
 
-    def _playback_finished(self, process: subprocess.Popen) -> None:
+    def _playback_finished(self, process: Union[subprocess.Popen, _BufferPlayback]) -> None:
         if self.play_process is not process:
             return
         self.play_process = None
-        self.playback_thread = None
         self._set_play_button_state(playing=False)
         self._set_status("再生完了")
 
@@ -994,7 +1721,9 @@ class Mp3LengthToolApp(tk.Tk):
                 except Exception:
                     pass
         self.play_process = None
-        self.playback_thread = None
+        if self._playback_poll_id is not None:
+            self.after_cancel(self._playback_poll_id)
+            self._playback_poll_id = None
         self._set_play_button_state(playing=False)
 
     def _set_play_button_state(self, *, playing: bool) -> None:
@@ -1010,6 +1739,7 @@ class Mp3LengthToolApp(tk.Tk):
         super().destroy()
 
     def _apply_pending_entry_values(self) -> bool:
+        self._flush_debounced()
         try:
             start_value = _parse_optional(
                 self.trim_start_var.get(),
@@ -1017,9 +1747,9 @@ class Mp3LengthToolApp(tk.Tk):
                 default=self.trim_start_seconds,
             )
             end_text = self.trim_end_var.get().strip()
-            end_value = parse_duration(end_text, allow_zero=True) if end_text else None
+            end_value = _parse_duration_cached(end_text, allow_zero=True) if end_text else None
             length_text = self.trim_length_var.get().strip()
-            length_value = parse_duration(length_text, allow_zero=False) if length_text else None
+            length_value = _parse_duration_cached(length_text, allow_zero=False) if length_text else None
         except ValueError as exc:
             messagebox.showerror("エラー", f"時間の指定が不正です: {exc}")
             return False
@@ -1085,26 +1815,27 @@ class Mp3LengthToolApp(tk.Tk):
 
     def _format_summary(self, result: ProcessResult) -> str:
         lines = [
-            f"入力全体: {format_duration(result.total_input_duration)} ({result.total_input_duration:.3f} 秒)",
+            f"入力全体: {_format_time(result.total_input_duration)} ({result.total_input_duration:.3f} 秒)",
             "セグメント:",
         ]
-        for idx, segment in enumerate(result.segments, 1):
-            lines.append(
-                f"  {idx:>2}: {format_duration(segment.start)} -> {format_duration(segment.end)} ({segment.duration:.3f} 秒)"
-            )
+        lines.extend(
+            _SEGMENT_LINE_TEMPLATE
+            % (idx, _format_time(segment.start), _format_time(segment.end), segment.duration)
+            for idx, segment in enumerate(result.segments, 1)
+        )
         lines.append(
-            f"合計長: {format_duration(result.total_segment_duration)} ({result.total_segment_duration:.3f} 秒)"
+            f"合計長: {_format_time(result.total_segment_duration)} ({result.total_segment_duration:.3f} 秒)"
         )
         if result.target_duration is not None:
             lines.append(
-                f"目標時間: {format_duration(result.target_duration)} ({result.target_duration:.3f} 秒)"
+                f"目標時間: {_format_time(result.target_duration)} ({result.target_duration:.3f} 秒)"
             )
             lines.append(f"再生速度倍率: {result.tempo_factor:.6f}x")
         else:
             lines.append("再生速度倍率: 1.000000x (変更なし)")
         if result.new_duration is not None:
             lines.append(
-                f"出力時間: {format_duration(result.new_duration)} ({result.new_duration:.3f} 秒)"
+                f"出力時間: {_format_time(result.new_duration)} ({result.new_duration:.3f} 秒)"
             )
             reference = (
                 result.target_duration
@@ -1119,7 +1850,7 @@ class Mp3LengthToolApp(tk.Tk):
         if result.dry_run:
             lines.append("")
             lines.append("コマンド:")
-            lines.append(format_command(result.ffmpeg_command))
+            lines.append(format_plan(result))
         else:
             lines.append("")
             lines.append(f"出力ファイル: {result.output_path}")
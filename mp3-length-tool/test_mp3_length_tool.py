@@ -0,0 +1,47 @@
+"""Tests for mp3_length_tool (run with ``python -m unittest`` from this directory)."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import mp3_length_tool
+
+# MPEG-1 Layer III, 44.1 kHz, stereo: 1152 samples per frame.
+_BITRATE_INDEX = {32: 1, 64: 5, 128: 9, 320: 14}
+_FRAME_SECONDS = 1152 / 44100
+
+
+def _frame(bitrate: int) -> bytes:
+    length = 144 * bitrate * 1000 // 44100
+    header = bytes((0xFF, 0xFB, _BITRATE_INDEX[bitrate] << 4, 0x00))
+    return header + bytes(length - 4)
+
+
+class ProbeDurationMp3Test(unittest.TestCase):
+    def _write(self, frames: list) -> Path:
+        handle, name = tempfile.mkstemp(suffix=".mp3")
+        with os.fdopen(handle, "wb") as stream:
+            stream.write(b"".join(frames))
+        self.addCleanup(os.unlink, name)
+        return Path(name)
+
+    def test_cbr_stream_without_frame_count(self) -> None:
+        count = 115  # ~3.0 s
+        path = self._write([_frame(128)] * count)
+        duration = mp3_length_tool.probe_duration_mp3(path)
+        self.assertIsNotNone(duration)
+        self.assertAlmostEqual(duration, count * _FRAME_SECONDS, delta=0.05)
+
+    def test_vbr_stream_without_frame_count_is_not_guessed(self) -> None:
+        # Loud 320 kbps opening, then quiet 32 kbps frames: the first frame's
+        # bitrate badly underestimates the ~3.0 s length.
+        frames = [_frame(320)] * 10 + [_frame(32)] * 105
+        path = self._write(frames)
+        self.assertIsNone(mp3_length_tool.probe_duration_mp3(path))
+
+
+if __name__ == "__main__":
+    unittest.main()